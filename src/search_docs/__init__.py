@@ -1 +1,3 @@
-from .config import Config
\ No newline at end of file
+from .config import Config
+from .interfaces import SheetResult
+from .api import iter_results
\ No newline at end of file
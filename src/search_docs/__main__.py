@@ -1,9 +1,28 @@
 from search_docs.factories import Factory
 from search_docs.config import Config
+from search_docs.readers import ArchiveReader
+from search_docs.matchers import KeywordMatcher
 import os
 import argparse
 from bteam_utils import CommonProgress
 
+def print_plan(plans: dict, throughput_mb: float) -> None:
+    """検索計画の表示
+    Args:
+        plans (dict): ドキュメントタイプごとの見積もり情報のリスト
+        throughput_mb (float): 1秒あたりに解析できるサイズ(MB)
+    """
+    for doc_type, plan in plans.items():
+        total_mb = sum(book['Cost'] for book in plan) / (1024 * 1024)
+        sheets = sum(book['Sheets'] for book in plan)
+        drawings = sum(book['Drawings'] for book in plan)
+        cells = sum(book.get('Cells', 0) for book in plan)
+        print(f'[{doc_type}] books={len(plan)} sheets={sheets} drawings={drawings} cells={cells} '
+              f'cost={total_mb:.1f}MB estimated={total_mb / throughput_mb:.1f}s')
+        # コストの大きい順（検索順）に表示
+        for book in plan:
+            print(f'{book["Cost"] / (1024 * 1024):10.2f}MB  sheets={book["Sheets"]} drawings={book["Drawings"]} cells={book.get("Cells", 0)}  {ArchiveReader.join(book["Path"], book["Book"])}')
+
 def main():
     """メイン処理
     """
@@ -11,6 +30,7 @@ def main():
     parser.add_argument('target_path', type=str, help='検索対象パス')
     parser.add_argument('--output_path', type=str, default='', help='出力先パスを指定（デフォルトは設定ファイルのoutput_path）')
     parser.add_argument('--keyword_list', type=str, default='',  help='キーワードのリストを指定（デフォルトは設定ファイルのkeyword_path）')
+    parser.add_argument('--plan', action='store_true', help='検索を行わずに見積もり（ブックごとのコストと予想時間）を表示')
     args = parser.parse_args()
 
     # 設定ファイルの読み込み
@@ -24,6 +44,11 @@ def main():
     if not os.path.exists(target_path):
         print(f'検索対象パスが存在しません: {target_path}')
         exit()
+    # 見積もりのみの場合は検索せずに終了
+    if args.plan:
+        print_plan(Factory.create(config=config).plan(target_path), config.plan_throughput_mb())
+        return
+
     # 出力先パスの存在確認、なければ作成
     if not os.path.exists(output_path):
         os.makedirs(output_path)
@@ -37,6 +62,12 @@ def main():
                 #空行および先頭文字が//の場合はコメント行として無視
                 if keyword != '' and not keyword.startswith('//'):
                     keywords.append(keyword)
+    # 正規表現キーワードの確認
+    invalid_keywords = KeywordMatcher.find_invalid(keywords, enable_regex=config.match_regex(), normalize=config.match_normalize())
+    if invalid_keywords:
+        for keyword in invalid_keywords:
+            print(f'正規表現が不正です: {keyword}')
+        exit()
 
     # 検索ドキュメントアダプターの生成
     seacher = Factory.create(config=config)
@@ -49,6 +80,11 @@ def main():
     seacher.save_results(output_path=output_path)
     if config.progress_display():
         progress.complete()
+    # 計測情報の表示（読み込み待ち時間と解析時間）
+    if config.metrics_display():
+        for doc_type, metrics in seacher.get_metrics().items():
+            print(f'[{doc_type}] io_wait={metrics["io_wait_sec"]}s parse={metrics["parse_sec"]}s '
+                  f'read={metrics["read_sec"]}s files={metrics["read_count"]} bytes={metrics["read_bytes"]} errors={metrics["error_count"]} direct={metrics.get("direct_count", 0)}')
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
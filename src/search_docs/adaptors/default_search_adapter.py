@@ -1,6 +1,7 @@
 from search_docs.interfaces import AbstractSearch
 from search_docs.interfaces import AbstractSearchDocs
-from typing import Optional, List, Type
+from search_docs.interfaces import SheetResult
+from typing import Optional, List, Dict, Iterator, Type
 import os
 
 class DefaultSearchAdapter(AbstractSearch):
@@ -10,15 +11,46 @@ class DefaultSearchAdapter(AbstractSearch):
         # protected attributes
     #
     _search_docs: Optional[List[AbstractSearchDocs]]    # 検索対象ドキュメント検索クラスのリスト
+    _results: Dict[str, List[SheetResult]]              # ドキュメントタイプごとの検索結果リスト
+    _keywords: Optional[List[str]]                      # 検索キーワードリスト
+    _enable_stats_output: bool                          # シート統計情報CSVの出力有無
 
-    def __init__(self, search_docs: Optional[List[AbstractSearchDocs]] = None) -> None:
+    def __init__(self, search_docs: Optional[List[AbstractSearchDocs]] = None, enable_stats_output: bool = False) -> None:
         """コンストラクタ
+        Args:
+            search_docs (Optional[List[AbstractSearchDocs]]): 検索対象ドキュメント検索クラスのリスト
+            enable_stats_output (bool): シートの宣言範囲と実データ範囲の統計情報を<ドキュメントタイプ>_stats.csvに出力するかどうか
         """
         self._search_docs = search_docs if search_docs else None
+        self._results = {}
+        self._keywords = None
+        self._enable_stats_output = enable_stats_output
 
     #
     # public methods
     #
+    def iter_results(self, target_path:str, keywords:Optional[List[str]]=None, enable_search_shapes:bool=False,
+                     cancel_event=None) -> Iterator[SheetResult]:
+        """シート単位の検索結果を順次返す
+        Args:
+            target_path (str): 検索対象パス
+            keywords (Optional[List[str]]): 検索キーワードリスト(Noneまたは空の場合は要素検索のみ実行)
+            enable_search_shapes (bool): 図形内検索を有効にするかどうか
+            cancel_event: 中断要求（is_set()がTrueになると終了する。threading.Eventなど）
+
+        Returns:
+            Iterator[SheetResult]: シート単位の検索結果（ブックの検索が終わるごとに返す）
+        """
+        # 検索対象ドキュメント検索クラスが設定されていない場合は何も返さない
+        if self._search_docs is None:
+            return
+
+        # 検索対象ドキュメント検索クラスのリストをループ
+        for search_doc in self._search_docs:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            yield from search_doc.iter_results(target_path, keywords, enable_search_shapes=enable_search_shapes, cancel_event=cancel_event)
+
     def search(self, target_path:str, keywords:Optional[List[str]]=None, enable_search_shapes:bool=False) -> bool:
         """ドキュメント検索処理
         Args:
@@ -32,24 +64,21 @@ class DefaultSearchAdapter(AbstractSearch):
         # 検索対象ドキュメント検索クラスが設定されていない場合は失敗を返す
         if self._search_docs is None:
             return False
-        
-        # 検索対象ドキュメント検索クラスのリストをループ
-        success = False
+
+        # 検索結果をドキュメントタイプごとに収集
+        self._results = {}
+        self._keywords = keywords if keywords else None
+        for result in self.iter_results(target_path, keywords, enable_search_shapes=enable_search_shapes):
+            self._results.setdefault(result.doc_type, []).append(result)
+        # 検索結果をドキュメント検索クラスにも保持（データフレームは取得時に作成）
         for search_doc in self._search_docs:
-            # ドキュメント要素検索処理を実行
-            if not search_doc.search_element(target_path):
-                continue
-            
-            # キーワード検索処理を実行
-            if keywords is not None:
-                if not search_doc.search_keyword(keywords, enable_search_shapes=enable_search_shapes):
-                    continue
-            
-            # ひとつでも成功した場合は成功フラグをTrueに設定
-            success = True
+            search_doc.set_results(self._results.get(search_doc.get_doc_type(), []), self._keywords)
 
-        # 復帰値を返す
-        return success
+        # キーワードリストが空の場合はキーワード検索失敗として扱う（要素検索結果は保存できる）
+        if keywords is not None and len(keywords) == 0:
+            return False
+        # ひとつでも結果がある場合は成功を返す
+        return len(self._results) > 0
     
     def save_results(self, output_path:str) -> bool:
         """検索結果保存処理
@@ -69,21 +98,59 @@ class DefaultSearchAdapter(AbstractSearch):
         # 検索対象ドキュメント検索クラスのリストをループ
         success = False
         for search_doc in self._search_docs:
-            # 検索結果保存処理を実行
-            pd_element = search_doc.get_element_list()
-            pd_keyword = search_doc.get_keyword_list()
             doc_type = search_doc.get_doc_type()
-            # 検索結果を出力
-            if pd_keyword is not None and not pd_keyword.empty:
-                # キーワード検索結果が存在する場合は要素検索結果も含まれているのでキーワード検索結果を保存
-                pd_keyword.to_csv(os.path.join(output_path, doc_type.lower()+'_search.csv'), encoding='utf-8-sig', index=False)
-            elif pd_element is not None and not pd_element.empty:
-                # 要素検索結果のみ存在する場合は要素検索結果を保存
-                pd_element.to_csv(os.path.join(output_path, doc_type.lower()+'_search.csv'), encoding='utf-8-sig', index=False)
-            else:
+            results = self._results.get(doc_type)
+            if not results:
                 continue
+            # 検索結果を要素検索結果の並び順で出力（キーワード検索した場合はキーワード列を含む）
+            pd_result = SheetResult.to_frame(sorted(results, key=lambda result: result.index), self._keywords)
+            pd_result.to_csv(os.path.join(output_path, doc_type.lower()+'_search.csv'), encoding='utf-8-sig', index=False)
+            # 統計情報の出力が有効な場合はセル検索したシートの統計情報を出力
+            if self._enable_stats_output:
+                pd_stats = SheetResult.to_stats_frame(sorted(results, key=lambda result: result.index))
+                if not pd_stats.empty:
+                    pd_stats.to_csv(os.path.join(output_path, doc_type.lower()+'_stats.csv'), encoding='utf-8-sig', index=False)
             # ひとつでも成功した場合は成功フラグをTrueに設定
             success = True
 
         # 復帰値を返す
-        return success
\ No newline at end of file
+        return success
+
+    def get_search_docs(self) -> List[AbstractSearchDocs]:
+        """検索対象ドキュメント検索クラスのリスト取得
+        Returns:
+            List[AbstractSearchDocs]: 検索対象ドキュメント検索クラスのリスト
+        """
+        return list(self._search_docs) if self._search_docs else []
+
+    def plan(self, target_path:str) -> dict:
+        """検索計画の作成（キーワード検索は行わない）
+        Args:
+            target_path (str): 検索対象パス
+
+        Returns:
+            dict: ドキュメントタイプごとの見積もり情報のリスト
+        """
+        plans = {}
+        if self._search_docs is None:
+            return plans
+        for search_doc in self._search_docs:
+            # カタログ情報から見積もりを作成（ブックは開かない）
+            plan = search_doc.get_plan(target_path)
+            if plan:
+                plans[search_doc.get_doc_type()] = plan
+        return plans
+
+    def get_metrics(self) -> dict:
+        """計測情報取得
+        Returns:
+            dict: ドキュメントタイプごとの計測情報の辞書
+        """
+        metrics = {}
+        if self._search_docs is None:
+            return metrics
+        for search_doc in self._search_docs:
+            doc_metrics = search_doc.get_metrics()
+            if doc_metrics:
+                metrics[search_doc.get_doc_type()] = doc_metrics
+        return metrics
@@ -0,0 +1,26 @@
+from search_docs.config import Config
+from search_docs.factories import Factory
+from search_docs.interfaces import SheetResult
+from typing import Iterator, List, Optional
+
+def iter_results(target_path: str, keywords: Optional[List[str]] = None, enable_search_shapes: bool = False,
+                 cancel_event=None, config: Optional[Config] = None, adaptor_type_name: Optional[str] = None) -> Iterator[SheetResult]:
+    """シート単位の検索結果を順次返す（サービスなどへの組み込み用）
+
+    ブックの検索が終わるごとにそのブックのシートの結果を返すため、全体の検索完了を待たずに結果を利用できる。
+    pandasは使用しない。検索を中断する場合はcancel_eventをセットするか、ジェネレータをclose()すること。
+
+    Args:
+        target_path (str): 検索対象パス
+        keywords (Optional[List[str]]): 検索キーワードリスト(Noneまたは空の場合は要素検索のみ実行)
+        enable_search_shapes (bool): 図形内検索を有効にするかどうか
+        cancel_event: 中断要求（is_set()がTrueになると終了する。threading.Eventなど）
+        config (Optional[Config]): 設定情報（Noneの場合はsettings.yamlを読み込む）
+        adaptor_type_name (Optional[str]): アダプターの型名（Noneの場合はデフォルトのアダプター）
+
+    Returns:
+        Iterator[SheetResult]: シート単位の検索結果
+    """
+    # 呼び出しごとにアダプターを生成（並行して呼び出された場合に状態を共有しない）
+    searcher = Factory.build(adaptor_type_name, config)
+    yield from searcher.iter_results(target_path, keywords, enable_search_shapes=enable_search_shapes, cancel_event=cancel_event)
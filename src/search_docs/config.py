@@ -103,6 +103,118 @@ class Config:
         """
         return str(self._config_data.get("shape_search", "")).lower() != 'false'
 
+    def prefetch_count(self) -> int:
+        """ブック先読み件数の取得
+
+        Returns:
+            int: 先読み件数(0の場合は先読みしない)
+        """
+        return max(0, int(self._config_data.get("prefetch_count", 2)))
+
+    def prefetch_buffer_mb(self) -> int:
+        """先読みバッファ上限の取得
+
+        Returns:
+            int: 先読みバッファの上限(MB)
+        """
+        return max(1, int(self._config_data.get("prefetch_buffer_mb", 256)))
+
+    def archive_max_depth(self) -> int:
+        """ZIPアーカイブ検索の深さの取得
+
+        Returns:
+            int: アーカイブを辿る最大の深さ(0:検索しない, 1:直下のアーカイブのみ, 2以上:入れ子も検索)
+        """
+        return max(0, int(self._config_data.get("archive_max_depth", 0)))
+
+    def archive_encoding(self) -> str:
+        """ZIPメンバー名の文字コードの取得
+
+        Returns:
+            str: UTF-8フラグのないメンバー名の文字コード（未設定の場合は空文字）
+        """
+        return str(self._config_data.get("archive_encoding", "") or "")
+
+    def archive_cache_mb(self) -> int:
+        """入れ子のZIPアーカイブのキャッシュ上限の取得
+
+        Returns:
+            int: 展開した入れ子のアーカイブをメモリにキャッシュする上限(MB)(上限を超えるアーカイブは一時ファイルに展開する)
+        """
+        return max(0, int(self._config_data.get("archive_cache_mb", 256)))
+
+    def shared_strings_spill_mb(self) -> int:
+        """共有文字列テーブルのディスク退避閾値の取得
+
+        Returns:
+            int: 共有文字列XMLがこのサイズ(MB)以上の場合にディスクへ退避する(0の場合は退避しない)
+        """
+        return max(0, int(self._config_data.get("shared_strings_spill_mb", 64)))
+
+    def plan_throughput_mb(self) -> float:
+        """見積もり用の処理速度の取得
+
+        Returns:
+            float: 1秒あたりに解析できるシートXMLのサイズ(MB)
+        """
+        return max(0.1, float(self._config_data.get("plan_throughput_mb", 20)))
+
+    def match_normalize(self) -> bool:
+        """キーワード照合のNFKC正規化設定の取得
+
+        Returns:
+            bool: 全角/半角などを統一して照合するかどうか(True:統一する, False:統一しない)
+        """
+        return str(self._config_data.get("match_normalize", "")).lower() == 'true'
+
+    def match_kana(self) -> bool:
+        """キーワード照合のひらがな/カタカナ同一視設定の取得
+
+        Returns:
+            bool: ひらがなとカタカナを区別せずに照合するかどうか(True:区別しない, False:区別する)
+        """
+        return str(self._config_data.get("match_kana", "")).lower() == 'true'
+
+    def match_ignore_case(self) -> bool:
+        """キーワード照合の大文字/小文字同一視設定の取得
+
+        Returns:
+            bool: 大文字と小文字を区別せずに照合するかどうか(True:区別しない, False:区別する)
+        """
+        return str(self._config_data.get("match_ignore_case", "")).lower() == 'true'
+
+    def match_regex(self) -> bool:
+        """正規表現キーワードの有効設定の取得
+
+        Returns:
+            bool: 「re:」で始まるキーワードを正規表現として扱うかどうか(True:正規表現, False:文字列)
+        """
+        return str(self._config_data.get("match_regex", "")).lower() == 'true'
+
+    def match_cache_size(self) -> int:
+        """キーワード照合結果のキャッシュ件数の取得
+
+        Returns:
+            int: 照合結果をキャッシュする文字列数(0の場合はキャッシュしない)
+        """
+        return max(0, int(self._config_data.get("match_cache_size", 262144)))
+
+    def metrics_display(self) -> bool:
+        """計測情報表示設定の取得
+
+        Returns:
+            bool: 計測情報表示設定(True:表示, False:非表示)
+        """
+        return str(self._config_data.get("metrics_display", "")).lower() == 'true'
+
+    def stats_output(self) -> bool:
+        """シート統計情報出力設定の取得
+
+        Returns:
+            bool: シートの宣言範囲と実データ範囲の統計情報CSVの出力設定(True:出力, False:非出力)
+        """
+        return str(self._config_data.get("stats_output", "")).lower() == 'true'
+
     #
     # protected methods
     #
@@ -122,6 +234,20 @@ class Config:
                 "keyword_path": "input/keywords.txt",
                 "progress_display": True,
                 "shape_search": True,
+                "prefetch_count": 2,
+                "prefetch_buffer_mb": 256,
+                "metrics_display": False,
+                "stats_output": False,
+                "plan_throughput_mb": 20,
+                "shared_strings_spill_mb": 64,
+                "archive_max_depth": 0,
+                "archive_encoding": "",
+                "archive_cache_mb": 256,
+                "match_normalize": False,
+                "match_kana": False,
+                "match_ignore_case": False,
+                "match_regex": False,
+                "match_cache_size": 262144,
             }
         else:
             # settings.yamlファイルの読み込み
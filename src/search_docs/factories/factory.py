@@ -39,6 +39,23 @@ class Factory:
         if cls._instance is not None and cls._cached_type == adaptor_type_name:
             return cls._instance
 
+        # アダプターを生成してキャッシュする
+        cls._instance = cls.build(adaptor_type_name, config)
+        cls._cached_type = adaptor_type_name
+
+        # 生成したアダプターを返す
+        return cls._instance
+
+    @classmethod
+    def build(cls, adaptor_type_name: Optional[str] = None, config: Optional[Config] = None) -> AbstractSearch:
+        """ 検索ドキュメントアダプター生成メソッド（キャッシュせずに毎回生成する）
+
+        Args:
+            adaptor_type_name (Optional[str], optional): アダプターの型名. デフォルトはNone.
+            config (Optional[Config], optional): 設定情報. デフォルトはNone（settings.yamlを読み込む）.
+        Returns:
+            AbstractSearch: AbstractSearchオブジェクト
+        """
         config = config if config else Config()
         if adaptor_type_name is None:
             # デフォルトで必要なモジュールをインポート
@@ -46,17 +63,27 @@ class Factory:
             from search_docs.search_docs import DefaultSearchExcel
             # adaptor_type_nameが指定されていない場合はデフォルトのアダプターを使用
             # デフォルトのドキュメント検索クラスリストを作成
-            default_search_docs: List[AbstractSearchDocs] = [DefaultSearchExcel(config.get("progress_display", True))]
+            default_search_docs: List[AbstractSearchDocs] = [
+                DefaultSearchExcel(
+                    config.get("progress_display", True),
+                    prefetch_count=config.prefetch_count(),
+                    prefetch_buffer_bytes=config.prefetch_buffer_mb() * 1024 * 1024,
+                    archive_max_depth=config.archive_max_depth(),
+                    archive_encoding=config.archive_encoding() or None,
+                    shared_strings_spill_bytes=config.shared_strings_spill_mb() * 1024 * 1024,
+                    match_normalize=config.match_normalize(),
+                    match_kana=config.match_kana(),
+                    match_ignore_case=config.match_ignore_case(),
+                    match_regex=config.match_regex(),
+                    match_cache_size=config.match_cache_size(),
+                    archive_cache_bytes=config.archive_cache_mb() * 1024 * 1024,
+                )
+            ]
             # デフォルトのアダプターを生成
-            cls._instance = DefaultSearchAdapter(default_search_docs)
-            cls._cached_type = adaptor_type_name
+            return DefaultSearchAdapter(default_search_docs, enable_stats_output=config.stats_output())
         else:
             # 指定された型名からアダプタークラスを動的にインポートして生成
             module_path, class_name = adaptor_type_name.rsplit('.', 1)
             module = importlib.import_module(module_path)
             adaptor_class = getattr(module, class_name)
-            cls._instance = adaptor_class()
-            cls._cached_type = adaptor_type_name
-
-        # 生成したアダプターを返す
-        return cls._instance
+            return adaptor_class()
@@ -1,2 +1,3 @@
+from .sheet_result import SheetResult
 from .abstract_search import AbstractSearch
 from .abstract_search_docs import AbstractSearchDocs
\ No newline at end of file
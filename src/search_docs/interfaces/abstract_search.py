@@ -1,4 +1,11 @@
 from abc import ABCMeta, abstractmethod
+from search_docs.interfaces.sheet_result import SheetResult
+from typing import TYPE_CHECKING, Iterator, List, Optional
+import csv
+import os
+import tempfile
+if TYPE_CHECKING:
+    from search_docs.interfaces.abstract_search_docs import AbstractSearchDocs
 
 class AbstractSearch(metaclass=ABCMeta):
     """ドキュメント検索抽象基底クラス
@@ -42,3 +49,87 @@ class AbstractSearch(metaclass=ABCMeta):
             bool: True:成功, False:失敗
         """
         pass
+
+    #
+    # public methods
+    #
+    def iter_results(self, target_path:str, keywords:Optional[list]=None, enable_search_shapes:bool=False,
+                     cancel_event=None) -> Iterator[SheetResult]:
+        """シート単位の検索結果を順次返す
+
+        既定の実装ではsearchの完了後に、get_search_docsで取得したドキュメント検索クラスの検索結果を返す。
+        ドキュメント検索クラスを取得できない場合は、save_resultsで一時フォルダへ保存した検索結果
+        （ドキュメントタイプごとの「<ドキュメントタイプ>_search.csv」）を読み込んで返す
+        （この場合のドキュメントタイプはファイル名から復元するため先頭だけ大文字になる。例: Excel）。
+        ブックごとに結果を返す場合はサブクラスでoverrideすること。
+
+        Args:
+            target_path (str): 検索対象パス
+            keywords (Optional[list]): 検索キーワードリスト(Noneまたは空の場合は要素検索のみ実行)
+            enable_search_shapes (bool): 図形内検索を有効にするかどうか
+            cancel_event: 中断要求（is_set()がTrueになると終了する。threading.Eventなど）
+
+        Returns:
+            Iterator[SheetResult]: シート単位の検索結果
+        """
+        # ドキュメント検索処理を実行（キーワードがない場合は要素検索のみ実行）
+        if not self.search(target_path, keywords if keywords else None, enable_search_shapes=enable_search_shapes):
+            if keywords:
+                return
+        # ドキュメント検索クラスの検索結果をそのまま返す
+        search_docs = self.get_search_docs()
+        if search_docs:
+            for search_doc in search_docs:
+                for result in search_doc.get_results():
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    yield result
+            return
+        # ドキュメント検索クラスを取得できない場合は保存した検索結果を読み込む
+        with tempfile.TemporaryDirectory(prefix='search_docs_') as output_path:
+            # 検索結果を一時フォルダに保存
+            if not self.save_results(output_path):
+                return
+            for file_name in sorted(os.listdir(output_path)):
+                if not file_name.endswith('_search.csv'):
+                    continue
+                doc_type = file_name[:-len('_search.csv')].capitalize()
+                # CSVの行をシート単位の検索結果に変換（Path, Book, Sheet以降の列はキーワード列）
+                with open(os.path.join(output_path, file_name), 'r', encoding='utf-8-sig', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, None)
+                    if not header:
+                        continue
+                    keyword_columns = header[3:]
+                    for index, row in enumerate(reader):
+                        if cancel_event is not None and cancel_event.is_set():
+                            return
+                        path, book, sheet = row[0], row[1], row[2]
+                        error = sheet == "Bad File Error"
+                        counts = {keyword: int(float(value)) if value else 0
+                                  for keyword, value in zip(keyword_columns, row[3:])} if keyword_columns and not error else None
+                        yield SheetResult(index, doc_type, path, book, sheet, counts, error)
+
+    def get_search_docs(self) -> List['AbstractSearchDocs']:
+        """検索対象ドキュメント検索クラスのリスト取得
+        Returns:
+            List[AbstractSearchDocs]: 検索対象ドキュメント検索クラスのリスト（公開しない場合は空のリスト）
+        """
+        return []
+
+    def plan(self, target_path:str) -> dict:
+        """検索計画の作成（キーワード検索は行わない）
+        Args:
+            target_path (str): 検索対象パス
+
+        Returns:
+            dict: ドキュメントタイプごとの見積もり情報のリスト（見積もらない場合は空の辞書）
+        """
+        return {}
+
+    def get_metrics(self) -> dict:
+        """計測情報取得
+        Returns:
+            dict: ドキュメントタイプごとの計測情報の辞書（計測しない場合は空の辞書）
+        """
+        return {}
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-import pandas as pd
+from search_docs.interfaces.sheet_result import SheetResult
+from typing import TYPE_CHECKING, Iterator, List, Optional
+if TYPE_CHECKING:
+    import pandas as pd
 
 class AbstractSearchDocs(ABC):
     """ドキュメント検索抽象基底クラス
@@ -8,8 +11,10 @@ class AbstractSearchDocs(ABC):
     _enable_progress: bool = True           # 進捗表示有無フラグ
     _doc_type: str = None                   # ドキュメントタイプ
     _extensions: list = []                  # 対応拡張子リスト
-    _pd_element: pd.DataFrame = None        # ドキュメント要素検索結果データフレーム
-    _pd_keyword: pd.DataFrame = None        # キーワード検索結果データフレーム
+    _pd_element: 'pd.DataFrame' = None      # ドキュメント要素検索結果データフレーム
+    _pd_keyword: 'pd.DataFrame' = None      # キーワード検索結果データフレーム
+    _results: Optional[List[SheetResult]] = None    # 収集済みのシート単位の検索結果（データフレーム未作成時に使用）
+    _keywords: Optional[List[str]] = None           # 収集済みの検索結果の検索キーワードリスト
 
     #
     # constructor/destructor
@@ -53,23 +58,135 @@ class AbstractSearchDocs(ABC):
         """
         pass
 
-    def get_element_list(self) -> pd.DataFrame:
+    def iter_results(self, target_path: str, keywords: Optional[list] = None, enable_search_shapes: bool = False,
+                     cancel_event=None) -> Iterator[SheetResult]:
+        """シート単位の検索結果を順次返す
+
+        既定の実装ではsearch_element, search_keywordの完了後に結果を返す。
+        ブックごとに結果を返す場合はサブクラスでoverrideすること。
+
+        Args:
+            target_path (str): 検索対象パス
+            keywords (Optional[list]): 検索キーワード（Noneまたは空の場合は要素検索のみ実行）
+            enable_search_shapes (bool): 図形内テキスト検索有効フラグ
+            cancel_event: 中断要求（is_set()がTrueになると次の結果を返さずに終了する。threading.Eventなど）
+
+        Returns:
+            Iterator[SheetResult]: シート単位の検索結果
+        """
+        # ドキュメント要素検索処理を実行
+        if not self.search_element(target_path):
+            return
+        # キーワード検索処理を実行
+        pd_result = self._pd_element
+        if keywords and self.search_keyword(keywords, enable_search_shapes=enable_search_shapes):
+            pd_result = self._pd_keyword
+        # データフレームの行をシート単位の検索結果に変換
+        for result in self._frame_to_results(pd_result):
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            yield result
+
+    def get_results(self) -> List[SheetResult]:
+        """検索結果取得
+        
+        set_resultsで設定した結果、またはキーワード検索結果（ない場合は要素検索結果）のデータフレームを
+        シート単位の検索結果に変換して返す。
+
+        Returns:
+            List[SheetResult]: シート単位の検索結果（要素検索結果の並び順）
+        """
+        if self._results is not None:
+            return list(self._results)
+        pd_result = self._pd_keyword if self._pd_keyword is not None else self._pd_element
+        return list(self._frame_to_results(pd_result)) if pd_result is not None else []
+
+    def set_results(self, results: List[SheetResult], keywords: Optional[List[str]] = None) -> None:
+        """収集済みの検索結果を設定
+
+        iter_resultsで収集した結果を保持し、データフレームは取得時に作成する。
+
+        Args:
+            results (List[SheetResult]): iter_resultsで収集したシート単位の検索結果
+            keywords (Optional[List[str]]): 検索キーワードリスト（要素検索のみの場合はNone）
+        """
+        self._results = sorted(results, key=lambda result: result.index)
+        self._keywords = list(keywords) if keywords else None
+        self._pd_element = None
+        self._pd_keyword = None
+
+    def get_element_list(self) -> 'pd.DataFrame':
         """ドキュメント要素検索結果取得
         Returns:
             pd.DataFrame: ドキュメント要素検索結果データフレーム
         """
+        # 収集済みの検索結果がある場合は初回取得時にデータフレームを作成
+        if self._pd_element is None and self._results is not None:
+            self._pd_element = SheetResult.to_frame(self._results)
         return self._pd_element
     
-    def get_keyword_list(self) -> pd.DataFrame:
+    def get_keyword_list(self) -> 'pd.DataFrame':
         """キーワード検索結果取得
         Returns:
             pd.DataFrame: キーワード検索結果データフレーム
         """
+        # 収集済みの検索結果がキーワード検索結果の場合は初回取得時にデータフレームを作成
+        if self._pd_keyword is None and self._results is not None and self._keywords:
+            self._pd_keyword = SheetResult.to_frame(self._results, self._keywords)
         return self._pd_keyword
     
+    def get_metrics(self) -> dict:
+        """計測情報取得
+        Returns:
+            dict: 計測情報の辞書（計測しない場合は空の辞書）
+        """
+        return {}
+
+    def get_plan(self, target_path: str) -> list:
+        """検索計画取得（キーワード検索は行わない）
+
+        計画はカタログ情報だけから作成してよい。その場合、検索時に開けないブックも計画に含まれる。
+
+        Args:
+            target_path (str): 検索対象パス
+        Returns:
+            list: ブックごとの見積もり情報の辞書のリスト（見積もらない場合は空のリスト）
+        """
+        return []
+
     def get_doc_type(self) -> str:
         """ドキュメントタイプ取得
         Returns:
             str: ドキュメントタイプ文字列
         """
-        return self._doc_type
\ No newline at end of file
+        return self._doc_type
+
+    #
+    # protected methods
+    #
+    def _frame_to_results(self, pd_result: 'pd.DataFrame') -> Iterator[SheetResult]:
+        """検索結果データフレームをシート単位の検索結果に変換
+        Args:
+            pd_result (pd.DataFrame): Path, Book, Sheetとキーワード列のデータフレーム
+        Returns:
+            Iterator[SheetResult]: シート単位の検索結果（キーワード列がない場合の出現数はNone）
+        """
+        keywords = list(pd_result.columns[3:])
+        for index, row in enumerate(pd_result.to_dict('records')):
+            # 開けないブックの出現数はNone（iter_resultsの結果と合わせる）
+            error = row['Sheet'] == "Bad File Error"
+            counts = {keyword: self._to_count(row[keyword]) for keyword in keywords} if keywords and not error else None
+            yield SheetResult(index, self._doc_type, row['Path'], row['Book'], row['Sheet'], counts, error)
+
+    @staticmethod
+    def _to_count(value) -> int:
+        """キーワード列の値を出現数に変換
+        Args:
+            value: キーワード列の値（出現数、None、空文字またはNaN）
+        Returns:
+            int: 出現数（値がない場合は0）
+        """
+        # NaNは自身と等しくならないため値なしとして扱う
+        if not value or value != value:
+            return 0
+        return int(value)
\ No newline at end of file
@@ -0,0 +1,101 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+if TYPE_CHECKING:
+    import pandas as pd
+
+class SheetResult:
+    """シート単位の検索結果クラス
+
+    pandasに依存しない軽量な検索結果で、iter_resultsからブックの検索が終わるごとに返される。
+    """
+    __slots__ = ('index', 'doc_type', 'path', 'book', 'sheet', 'counts', 'error', 'stats')
+
+    #
+    # constructor/destructor
+    #
+    def __init__(self, index: int, doc_type: str, path: str, book: str, sheet: str,
+                 counts: Optional[Dict[str, int]] = None, error: bool = False, stats: Optional[object] = None) -> None:
+        """コンストラクタ
+        Args:
+            index (int): 要素検索結果での並び順（0始まり）
+            doc_type (str): ドキュメントタイプ
+            path (str): Path列の値（フォルダまたはアーカイブパス）
+            book (str): Book列の値（ファイル名またはメンバーパス）
+            sheet (str): Sheet列の値（開けないファイルの場合は"Bad File Error"）
+            counts (Optional[Dict[str, int]]): キーワードごとの出現数（キーワード検索していない場合はNone）
+            error (bool): ファイルが開けなかった場合はTrue
+            stats (Optional[object]): 宣言されたシート範囲と値のあるセル範囲の統計情報（セル検索していない場合はNone）
+        """
+        self.index = index
+        self.doc_type = doc_type
+        self.path = path
+        self.book = book
+        self.sheet = sheet
+        self.counts = counts
+        self.error = error
+        self.stats = stats
+
+    def __repr__(self) -> str:
+        """文字列表現
+        Returns:
+            str: 文字列表現
+        """
+        return (f'SheetResult(index={self.index!r}, doc_type={self.doc_type!r}, path={self.path!r}, '
+                f'book={self.book!r}, sheet={self.sheet!r}, counts={self.counts!r}, error={self.error!r}, stats={self.stats!r})')
+
+    #
+    # public methods
+    #
+    @staticmethod
+    def to_frame(results: Iterable['SheetResult'], keywords: Optional[List[str]] = None) -> 'pd.DataFrame':
+        """検索結果をデータフレームに変換
+
+        出現数が0またはキーワード検索していない場合は空文字を設定する（CSV出力と同じ形式）。
+
+        Args:
+            results (Iterable[SheetResult]): 検索結果（要素検索結果の並び順であること）
+            keywords (Optional[List[str]]): キーワード列として追加する検索キーワードリスト
+        Returns:
+            pd.DataFrame: Path, Book, Sheetとキーワード列のデータフレーム
+        """
+        import pandas as pd
+        # キーワード列（重複するキーワードは1列にまとめる）
+        keyword_columns = list(dict.fromkeys(keywords)) if keywords else []
+        rows = []
+        for result in results:
+            row = {
+                'Path': result.path,
+                'Book': result.book,
+                'Sheet': result.sheet,
+            }
+            for keyword in keyword_columns:
+                count = result.counts.get(keyword, 0) if result.counts else 0
+                row[keyword] = count if count else ""
+            rows.append(row)
+        return pd.DataFrame(rows, columns=['Path', 'Book', 'Sheet'] + keyword_columns)
+
+    @staticmethod
+    def to_stats_frame(results: Iterable['SheetResult']) -> 'pd.DataFrame':
+        """統計情報をデータフレームに変換（統計情報のないシートは含めない）
+        Args:
+            results (Iterable[SheetResult]): 検索結果（要素検索結果の並び順であること）
+        Returns:
+            pd.DataFrame: Path, Book, Sheetと宣言されたシート範囲、値のあるセル範囲、行数、セル数のデータフレーム
+        """
+        import pandas as pd
+        columns = ['Path', 'Book', 'Sheet', 'Declared', 'Used', 'XmlRows', 'ValueRows', 'ValueCells']
+        rows = []
+        for result in results:
+            stats = result.stats
+            if stats is None:
+                continue
+            rows.append({
+                'Path': result.path,
+                'Book': result.book,
+                'Sheet': result.sheet,
+                'Declared': stats.declared or "",
+                'Used': stats.used() or "",
+                'XmlRows': stats.xml_rows,
+                'ValueRows': stats.value_rows,
+                'ValueCells': stats.value_cells,
+            })
+        return pd.DataFrame(rows, columns=columns)
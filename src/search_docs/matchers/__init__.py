@@ -0,0 +1 @@
+from .keyword_matcher import KeywordMatcher
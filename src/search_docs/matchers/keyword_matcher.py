@@ -0,0 +1,192 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import re
+import unicodedata
+
+class KeywordMatcher:
+    """キーワード照合クラス
+
+    検索キーワードリストを一度だけコンパイルし、文字列に含まれるキーワードを返す。
+    enable_regexが有効な場合、「re:」で始まるキーワードは正規表現として扱う。正規化（NFKC、ひらがな/カタカナ、大文字/小文字）を
+    有効にした場合はキーワードと検索対象の文字列の両方を正規化して照合する。
+    正規表現キーワードはNFKC正規化とひらがな/カタカナの統一だけを行い（全角の記号も正規表現の記号として扱われる）、
+    大文字/小文字はre.IGNORECASEで区別しない。
+    照合結果は文字列ごとにキャッシュするため、同じ文字列の正規化と照合は一度だけ行われる。
+    """
+    REGEX_PREFIX: str = 're:'               # 正規表現キーワードの接頭辞
+
+    # ひらがなをカタカナに変換する変換表（ぁ〜ゖ → ァ〜ヶ, ゝゞ → ヽヾ）
+    _HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in list(range(0x3041, 0x3097)) + [0x309D, 0x309E]}
+
+    #
+    # constructor/destructor
+    #
+    def __init__(self, keywords: List[str], normalize: bool = False, kana: bool = False, ignore_case: bool = False,
+                 enable_regex: bool = False, cache_size: int = 262144) -> None:
+        """コンストラクタ
+        Args:
+            keywords (List[str]): 検索キーワードリスト（keywords.txtの行）
+            normalize (bool): NFKC正規化（全角/半角の統一など）を行うかどうか
+            kana (bool): ひらがなとカタカナを区別しないかどうか
+            ignore_case (bool): 大文字と小文字を区別しないかどうか
+            enable_regex (bool): 「re:」で始まるキーワードを正規表現として扱うかどうか
+            cache_size (int): 照合結果をキャッシュする文字列数（0の場合はキャッシュしない）
+        """
+        self.keywords = list(keywords)                 # 検索キーワードリスト（出現数のキー）
+        self._normalize_nfkc = normalize
+        self._kana = kana
+        self._ignore_case = ignore_case
+        self._enable_regex = enable_regex
+
+        # キーワードごとの照合方法をコンパイル
+        flags = re.IGNORECASE if ignore_case else 0
+        self._literals: List[Tuple[str, str]] = []              # (キーワード, 正規化済み文字列)
+        self._patterns: List[Tuple[str, re.Pattern]] = []       # (キーワード, コンパイル済み正規表現)
+        self._unfiltered: List[Tuple[str, re.Pattern]] = []     # まとめた正規表現に含められない正規表現
+        literal_sources = []
+        pattern_sources = []
+        for keyword in self.keywords:
+            if self._is_regex(keyword):
+                source = self._fold(keyword[len(self.REGEX_PREFIX):])
+                pattern = self._compile(source, flags, keyword)
+                # グループを含む正規表現は連結すると後方参照の番号がずれるため個別に照合する
+                if pattern.groups:
+                    self._unfiltered.append((keyword, pattern))
+                else:
+                    self._patterns.append((keyword, pattern))
+                    pattern_sources.append(f'(?:{source})')
+            else:
+                literal = self.normalize(keyword)
+                self._literals.append((keyword, literal))
+                literal_sources.append(re.escape(literal))
+        # キーワードをまとめた照合用の正規表現（含まれない文字列を一度の走査で除外する）
+        # 文字列キーワードは正規化した文字列、正規表現キーワードは大文字/小文字を統一しない文字列に対して照合する
+        self._literal_filter = re.compile('|'.join(literal_sources)) if literal_sources else None
+        self._pattern_filter = self._combine(pattern_sources, flags)
+
+        # 照合結果のキャッシュ
+        if cache_size > 0:
+            self.match = lru_cache(maxsize=cache_size)(self.match)
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # public methods
+    #
+    def match(self, text: str) -> Tuple[str, ...]:
+        """文字列に含まれるキーワードの取得
+        Args:
+            text (str): 検索対象の文字列
+        Returns:
+            Tuple[str, ...]: 含まれるキーワード（キーワードリストの順。重複する行はその数だけ含む）
+        """
+        if not self.keywords:
+            return ()
+        # 正規表現用（NFKC、ひらがな/カタカナ）と文字列キーワード用（さらに大文字/小文字を統一）の文字列
+        folded = self._fold(text)
+        normalized = folded.casefold() if self._ignore_case else folded
+        matched = {keyword for keyword, pattern in self._unfiltered if pattern.search(folded)}
+        if self._literal_filter is not None and self._literal_filter.search(normalized):
+            matched.update(keyword for keyword, literal in self._literals if literal in normalized)
+        if self._pattern_filter is not None and self._pattern_filter.search(folded):
+            matched.update(keyword for keyword, pattern in self._patterns if pattern.search(folded))
+        if not matched:
+            return ()
+        return tuple(keyword for keyword in self.keywords if keyword in matched)
+
+    def normalize(self, text: str) -> str:
+        """文字列の正規化（文字列キーワードの照合用）
+        Args:
+            text (str): 文字列
+        Returns:
+            str: 設定に従って正規化した文字列
+        """
+        text = self._fold(text)
+        if self._ignore_case:
+            text = text.casefold()
+        return text
+
+    @classmethod
+    def find_invalid(cls, keywords: List[str], enable_regex: bool = False, normalize: bool = False) -> List[str]:
+        """不正な正規表現キーワードの取得
+        Args:
+            keywords (List[str]): 検索キーワードリスト
+            enable_regex (bool): 「re:」で始まるキーワードを正規表現として扱うかどうか
+            normalize (bool): 正規表現をNFKC正規化してからコンパイルするかどうか
+        Returns:
+            List[str]: コンパイルできない正規表現キーワードのリスト
+        """
+        invalid = []
+        if not enable_regex:
+            return invalid
+        for keyword in keywords:
+            if keyword.startswith(cls.REGEX_PREFIX):
+                source = keyword[len(cls.REGEX_PREFIX):]
+                if normalize:
+                    source = unicodedata.normalize('NFKC', source)
+                try:
+                    re.compile(source)
+                except re.error:
+                    invalid.append(keyword)
+        return invalid
+
+    #
+    # protected methods
+    #
+    def _is_regex(self, keyword: str) -> bool:
+        """正規表現キーワードの判定
+        Args:
+            keyword (str): キーワード
+        Returns:
+            bool: 正規表現として扱う場合はTrue
+        """
+        return self._enable_regex and keyword.startswith(self.REGEX_PREFIX)
+
+    def _fold(self, text: str) -> str:
+        """NFKC正規化とひらがなのカタカナへの変換（それぞれ有効な場合のみ）
+        Args:
+            text (str): 文字列
+        Returns:
+            str: 変換後の文字列
+        """
+        if self._normalize_nfkc:
+            text = unicodedata.normalize('NFKC', text)
+        if self._kana:
+            text = text.translate(self._HIRAGANA_TO_KATAKANA)
+        return text
+
+    def _combine(self, pattern_sources: List[str], flags: int) -> Optional[re.Pattern]:
+        """正規表現キーワードをまとめた正規表現の作成
+        Args:
+            pattern_sources (List[str]): グループを含まない正規表現キーワード
+            flags (int): フラグ
+        Returns:
+            Optional[re.Pattern]: まとめた正規表現（対象のキーワードがない場合はNone）
+        """
+        if not pattern_sources:
+            return None
+        try:
+            return re.compile('|'.join(pattern_sources), flags)
+        except re.error:
+            # インラインフラグなど連結できない正規表現がある場合は、正規表現キーワードを個別に照合する
+            self._unfiltered.extend(self._patterns)
+            self._patterns = []
+            return None
+
+    @staticmethod
+    def _compile(source: str, flags: int, keyword: str) -> re.Pattern:
+        """正規表現のコンパイル
+        Args:
+            source (str): 正規表現
+            flags (int): フラグ
+            keyword (str): 元のキーワード（エラーメッセージ用）
+        Returns:
+            re.Pattern: コンパイル済み正規表現
+        """
+        try:
+            return re.compile(source, flags)
+        except re.error as e:
+            raise ValueError(f'正規表現が不正です: {keyword} ({e})') from e
@@ -0,0 +1,5 @@
+from .workbook_prefetcher import WorkbookPrefetcher, PrefetchMetrics
+from .archive_reader import ArchiveReader
+from .workbook_catalog import WorkbookCatalog, BookCatalog, SheetCatalog
+from .sheet_cell_reader import SheetCellReader, SheetStats
+from .shared_string_table import DiskStringTable, SpillingExcelReader, load_workbook
\ No newline at end of file
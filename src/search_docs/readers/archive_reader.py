@@ -0,0 +1,298 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import io
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+
+class ArchiveReader:
+    """アーカイブ読み込みクラス
+
+    ZIPアーカイブを展開せずに走査し、アーカイブ内のドキュメントを読み込む。
+    アーカイブ内のドキュメントは「アーカイブパス::メンバーパス」形式の文字列で表し、
+    入れ子のアーカイブは「外側::内側.zip::メンバーパス」のように連結する。
+    展開した入れ子のアーカイブは上限サイズまでメモリにキャッシュし、上限を超えるアーカイブは一時ファイルに書き出して、
+    同じアーカイブ内のドキュメントを読み込むたびに展開し直さないようにする（キャッシュはスレッド間で共有する）。
+    開けないアーカイブ（破損、暗号化、未対応の圧縮形式など）はアーカイブ自体をドキュメントとして返し、
+    読み込み時に失敗させることで呼び出し側で「Bad File Error」として扱えるようにする。
+    """
+    ARCHIVE_SEPARATOR: str = '::'               # アーカイブパスとメンバーパスの区切り文字
+    ARCHIVE_EXTENSIONS: tuple = ('.zip',)       # 対応アーカイブ拡張子
+
+    #
+    # constructor/destructor
+    #
+    def __init__(self, extensions: list, max_depth: int = 1, encoding: Optional[str] = None,
+                 cache_bytes: int = 256 * 1024 * 1024) -> None:
+        """コンストラクタ
+        Args:
+            extensions (list): 検索対象ドキュメントの拡張子リスト
+            max_depth (int): アーカイブを辿る最大の深さ(0:辿らない, 1:直下のアーカイブのみ, 2以上:入れ子も辿る)
+            encoding (Optional[str]): UTF-8フラグのないメンバー名の文字コード（Noneの場合はcp437）
+            cache_bytes (int): 展開した入れ子のアーカイブをメモリにキャッシュする上限バイト数(上限を超えるアーカイブは一時ファイルに書き出す)
+        """
+        self._extensions = tuple(extensions)
+        self._max_depth = max(0, int(max_depth))
+        self._encoding = encoding if encoding else None
+        self._sizes: Dict[str, int] = {}
+        self._cache_bytes = max(0, int(cache_bytes))
+        self._cache: 'OrderedDict[str, bytes]' = OrderedDict()     # 入れ子のアーカイブの内容（古い順）
+        self._cached_bytes = 0
+        self._spilled: Dict[str, str] = {}                          # 一時ファイルに書き出した入れ子のアーカイブのパス
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._cache_lock = threading.Lock()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        self.close()
+
+    #
+    # public methods
+    #
+    def is_enabled(self) -> bool:
+        """アーカイブ走査の有効判定
+        Returns:
+            bool: True:有効, False:無効
+        """
+        return self._max_depth > 0
+
+    def close(self) -> None:
+        """キャッシュと一時ファイルの解放
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cached_bytes = 0
+            self._spilled.clear()
+            spill_dir, self._spill_dir = self._spill_dir, None
+        if spill_dir is not None:
+            try:
+                spill_dir.cleanup()
+            except Exception:
+                pass
+
+    def walk(self, archive_path: str) -> List[str]:
+        """アーカイブ内のドキュメント一覧取得
+        Args:
+            archive_path (str): アーカイブのファイルパス
+        Returns:
+            List[str]: アーカイブ内ドキュメントのリスト（「アーカイブパス::メンバーパス」形式。
+                開けないアーカイブはアーカイブ自体を含む）
+        """
+        sources: List[str] = []
+        if not self.is_enabled():
+            return sources
+        try:
+            with open(archive_path, 'rb') as f:
+                self._walk_archive(f, archive_path, 1, sources)
+        except Exception:
+            # 開けないアーカイブ（未対応の圧縮形式、暗号化、破損したデータなど）はアーカイブ自体を登録する
+            sources.append(archive_path)
+        return sources
+
+    def read(self, source: str) -> bytes:
+        """ドキュメントの読み込み
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            bytes: ドキュメントの内容
+        """
+        if self.ARCHIVE_SEPARATOR not in source:
+            with open(source, 'rb') as f:
+                return f.read()
+        archive_source, member = source.rsplit(self.ARCHIVE_SEPARATOR, 1)
+        return self._read_member(archive_source, member)
+
+    def open(self, source: str):
+        """ドキュメントをバイナリストリームとして開く
+
+        通常のファイルはそのまま開くため、呼び出し側で必要な箇所だけを読み込める。
+        アーカイブ内のドキュメントはメモリに読み込んだストリームを返す。
+        開けないアーカイブ自体を指定した場合はzipfile.BadZipFileなどの例外を送出する。
+
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            シーク可能なバイナリストリーム（呼び出し側で閉じること）
+        """
+        if self.ARCHIVE_SEPARATOR not in source:
+            return open(source, 'rb')
+        return io.BytesIO(self.read(source))
+
+    def size(self, source: str) -> int:
+        """ドキュメントのサイズ取得（展開後のサイズ）
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            int: ドキュメントのサイズ（取得できない場合は0）
+        """
+        if source in self._sizes:
+            return self._sizes[source]
+        try:
+            return os.path.getsize(source)
+        except OSError:
+            return 0
+
+    @classmethod
+    def is_archive(cls, file_name: str) -> bool:
+        """アーカイブファイル判定
+        Args:
+            file_name (str): ファイル名
+        Returns:
+            bool: True:アーカイブ, False:アーカイブ以外
+        """
+        return file_name.lower().endswith(cls.ARCHIVE_EXTENSIONS)
+
+    @classmethod
+    def is_archive_member(cls, path: str) -> bool:
+        """アーカイブ内のパスか判定
+        Args:
+            path (str): Path列の値
+        Returns:
+            bool: True:アーカイブ内, False:通常のフォルダ
+        """
+        return cls.ARCHIVE_SEPARATOR in path or (cls.is_archive(path) and os.path.isfile(path))
+
+    @classmethod
+    def join(cls, path: str, book: str) -> str:
+        """Path列とBook列からドキュメントを表す文字列を生成
+        Args:
+            path (str): Path列の値（フォルダまたはアーカイブパス）
+            book (str): Book列の値（ファイル名またはメンバーパス）
+        Returns:
+            str: ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        """
+        if cls.is_archive_member(path):
+            return path + cls.ARCHIVE_SEPARATOR + book
+        return os.path.join(path, book)
+
+    @classmethod
+    def split(cls, source: str) -> Tuple[str, str]:
+        """ドキュメントを表す文字列をPath列とBook列に分割
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            Tuple[str, str]: (Path列の値, Book列の値)
+        """
+        if cls.ARCHIVE_SEPARATOR in source:
+            path, book = source.rsplit(cls.ARCHIVE_SEPARATOR, 1)
+            return path, book
+        return os.path.dirname(source), os.path.basename(source)
+
+    #
+    # protected methods
+    #
+    def _walk_archive(self, stream, archive_source: str, depth: int, sources: List[str]) -> None:
+        """アーカイブ内を再帰的に走査
+        Args:
+            stream: アーカイブのストリーム
+            archive_source (str): アーカイブを表す文字列
+            depth (int): 現在の深さ
+            sources (List[str]): 見つかったドキュメントの格納先
+        """
+        with zipfile.ZipFile(stream, metadata_encoding=self._encoding) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                source = archive_source + self.ARCHIVE_SEPARATOR + info.filename
+                if info.filename.endswith(self._extensions):
+                    # 検索対象ドキュメントの場合は登録
+                    sources.append(source)
+                    self._sizes[source] = info.file_size
+                elif self.is_archive(info.filename) and depth < self._max_depth:
+                    # 入れ子のアーカイブは展開してキャッシュしてから辿る
+                    try:
+                        with self._extract_archive(archive, info, source) as inner:
+                            self._walk_archive(inner, source, depth + 1, sources)
+                    except Exception:
+                        # 読み込めない入れ子のアーカイブはアーカイブ自体を登録する
+                        sources.append(source)
+
+    def _read_member(self, archive_source: str, member: str) -> bytes:
+        """アーカイブ内のメンバーの読み込み
+        Args:
+            archive_source (str): アーカイブを表す文字列（ファイルパスまたは入れ子のアーカイブ）
+            member (str): メンバーパス
+        Returns:
+            bytes: メンバーの内容
+        """
+        with self._open_archive(archive_source) as stream:
+            with zipfile.ZipFile(stream, metadata_encoding=self._encoding) as archive:
+                return archive.read(member)
+
+    def _open_archive(self, archive_source: str):
+        """アーカイブをバイナリストリームとして開く（入れ子のアーカイブはキャッシュにある場合は展開しない）
+        Args:
+            archive_source (str): アーカイブを表す文字列（ファイルパスまたは「アーカイブパス::メンバーパス」形式）
+        Returns:
+            シーク可能なバイナリストリーム（呼び出し側で閉じること）
+        """
+        if self.ARCHIVE_SEPARATOR not in archive_source:
+            return open(archive_source, 'rb')
+        with self._cache_lock:
+            data = self._cache.get(archive_source)
+            if data is not None:
+                self._cache.move_to_end(archive_source)
+                return io.BytesIO(data)
+            spilled = self._spilled.get(archive_source)
+        if spilled is not None:
+            return open(spilled, 'rb')
+        parent_source, member = archive_source.rsplit(self.ARCHIVE_SEPARATOR, 1)
+        with self._open_archive(parent_source) as stream:
+            with zipfile.ZipFile(stream, metadata_encoding=self._encoding) as archive:
+                return self._extract_archive(archive, archive.getinfo(member), archive_source)
+
+    def _extract_archive(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo, archive_source: str):
+        """入れ子のアーカイブを展開してキャッシュに登録
+
+        上限サイズ以下のアーカイブはメモリに、上限を超えるアーカイブは一時ファイルに展開する。
+
+        Args:
+            archive (zipfile.ZipFile): 外側のアーカイブ
+            info (zipfile.ZipInfo): 入れ子のアーカイブのメンバー情報
+            archive_source (str): 入れ子のアーカイブを表す文字列
+        Returns:
+            展開したアーカイブのシーク可能なバイナリストリーム（呼び出し側で閉じること）
+        """
+        if info.file_size <= self._cache_bytes:
+            data = archive.read(info)
+            self._cache_archive(archive_source, data)
+            return io.BytesIO(data)
+        # メモリに保持せず、一時ファイルへ順次書き出す
+        with self._cache_lock:
+            if self._spill_dir is None:
+                self._spill_dir = tempfile.TemporaryDirectory(prefix='search_docs_zip_')
+            spill_dir = self._spill_dir.name
+        fd, path = tempfile.mkstemp(suffix='.zip', dir=spill_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f, archive.open(info) as member:
+                shutil.copyfileobj(member, f)
+        except Exception:
+            os.remove(path)
+            raise
+        with self._cache_lock:
+            # 他のスレッドが先に書き出していた場合はそちらを使う
+            spilled = self._spilled.setdefault(archive_source, path)
+        if spilled != path:
+            os.remove(path)
+        return open(spilled, 'rb')
+
+    def _cache_archive(self, archive_source: str, data: bytes) -> None:
+        """入れ子のアーカイブをキャッシュに登録（上限を超える場合は古いものから破棄する）
+        Args:
+            archive_source (str): 入れ子のアーカイブを表す文字列
+            data (bytes): アーカイブの内容
+        """
+        if len(data) > self._cache_bytes:
+            return
+        with self._cache_lock:
+            if archive_source in self._cache:
+                self._cache.move_to_end(archive_source)
+                return
+            while self._cache and self._cached_bytes + len(data) > self._cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+            self._cache[archive_source] = data
+            self._cached_bytes += len(data)
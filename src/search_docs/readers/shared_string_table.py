@@ -0,0 +1,190 @@
+from openpyxl.cell.text import Text
+from openpyxl.reader.excel import ExcelReader
+from openpyxl.xml.constants import SHARED_STRINGS, SHEET_MAIN_NS
+from openpyxl.xml.functions import iterparse
+from array import array
+from typing import Optional, Tuple
+import mmap
+import struct
+import tempfile
+
+class DiskStringTable:
+    """ディスク上の共有文字列テーブルクラス
+
+    共有文字列をUTF-8で一時ファイルへ書き出し、文字列ごとの開始位置を別の一時ファイルに保持する。
+    参照時はメモリマップしたファイルから該当する文字列だけをデコードするため、
+    文字列の数に関係なくメモリ使用量を抑えられる。openpyxlのシート解析からはリストと同様に参照できる。
+    """
+    _OFFSET = struct.Struct('<Q')       # 開始位置の形式（8バイト符号なし整数）
+    _FLUSH_COUNT = 64 * 1024            # 開始位置をファイルへ書き出す単位（件数）
+
+    #
+    # constructor/destructor
+    #
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """コンストラクタ
+        Args:
+            directory (Optional[str]): 一時ファイルの作成先（Noneの場合はOSの一時フォルダ）
+        """
+        self._data_file = tempfile.TemporaryFile(prefix='search_docs_sst_', dir=directory)
+        self._offset_file = tempfile.TemporaryFile(prefix='search_docs_sst_', dir=directory)
+        self._data: Optional[mmap.mmap] = None
+        self._offsets: Optional[mmap.mmap] = None
+        self._count = 0
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        self.close()
+
+    #
+    # public methods
+    #
+    @classmethod
+    def from_xml(cls, xml_source, directory: Optional[str] = None) -> 'DiskStringTable':
+        """共有文字列XML(xl/sharedStrings.xml)からテーブルを作成
+        Args:
+            xml_source: 共有文字列XMLのストリーム
+            directory (Optional[str]): 一時ファイルの作成先
+        Returns:
+            DiskStringTable: 共有文字列テーブル
+        """
+        table = cls(directory)
+        string_tag = '{%s}si' % SHEET_MAIN_NS
+        offsets = array('Q', [0])
+        position = 0
+        root = None
+        try:
+            for event, node in iterparse(xml_source, events=('start', 'end')):
+                if root is None:
+                    root = node
+                if event != 'end' or node.tag != string_tag:
+                    continue
+                # openpyxlのread_string_tableと同じ変換を行う
+                text = Text.from_tree(node).content.replace('x005F_', '')
+                data = text.encode('utf-8')
+                table._data_file.write(data)
+                position += len(data)
+                offsets.append(position)
+                table._count += 1
+                # 解析済みの要素を解放して、読み込み中のメモリ使用量も抑える
+                root.clear()
+                if len(offsets) >= cls._FLUSH_COUNT:
+                    offsets.tofile(table._offset_file)
+                    offsets = array('Q')
+            offsets.tofile(table._offset_file)
+            table._map()
+        except Exception:
+            table.close()
+            raise
+        return table
+
+    def close(self) -> None:
+        """一時ファイルの解放
+        """
+        for attr in ('_data', '_offsets', '_data_file', '_offset_file'):
+            resource = getattr(self, attr, None)
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+
+    def __len__(self) -> int:
+        """文字列数の取得
+        Returns:
+            int: 文字列数
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        """文字列の取得
+        Args:
+            index (int): 共有文字列のインデックス
+        Returns:
+            str: 文字列
+        """
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError('shared string index out of range')
+        start, = self._OFFSET.unpack_from(self._offsets, index * self._OFFSET.size)
+        end, = self._OFFSET.unpack_from(self._offsets, (index + 1) * self._OFFSET.size)
+        if start == end:
+            return ''
+        return self._data[start:end].decode('utf-8')
+
+    #
+    # protected methods
+    #
+    def _map(self) -> None:
+        """一時ファイルをメモリマップする
+        """
+        self._data_file.flush()
+        self._offset_file.flush()
+        self._offsets = mmap.mmap(self._offset_file.fileno(), 0, access=mmap.ACCESS_READ)
+        # 空のファイルはメモリマップできないため、すべて空文字の場合はマップしない
+        if self._data_file.tell() > 0:
+            self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+class SpillingExcelReader(ExcelReader):
+    """共有文字列テーブルをディスクへ退避するExcel読み込みクラス
+
+    共有文字列XMLの展開後サイズが閾値以上の場合、文字列をPythonのリストに読み込まずに
+    DiskStringTableへ書き出す。閾値未満の場合はopenpyxlの通常の読み込みを行う。
+    openpyxlの非公開APIに依存するため、openpyxlは3.1系に固定している（pyproject.toml）。
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, fn, spill_bytes: int = 0, spill_dir: Optional[str] = None, **kwargs) -> None:
+        """コンストラクタ
+        Args:
+            fn: ファイルパスまたはストリーム
+            spill_bytes (int): ディスクへ退避する共有文字列XMLのサイズの閾値（0の場合は退避しない）
+            spill_dir (Optional[str]): 一時ファイルの作成先
+            **kwargs: openpyxlのExcelReaderに渡す引数
+        """
+        super().__init__(fn, **kwargs)
+        self._spill_bytes = spill_bytes
+        self._spill_dir = spill_dir
+        self.spilled_strings: Optional[DiskStringTable] = None
+
+    #
+    # public methods
+    #
+    def read_strings(self) -> None:
+        """共有文字列テーブルの読み込み
+        """
+        ct = self.package.find(SHARED_STRINGS)
+        if ct is not None and self._spill_bytes > 0 and not self.rich_text:
+            strings_path = ct.PartName[1:]
+            if self.archive.getinfo(strings_path).file_size >= self._spill_bytes:
+                with self.archive.open(strings_path) as src:
+                    self.spilled_strings = DiskStringTable.from_xml(src, self._spill_dir)
+                self.shared_strings = self.spilled_strings
+                return
+        super().read_strings()
+
+def load_workbook(filename, spill_bytes: int = 0, spill_dir: Optional[str] = None) -> Tuple[object, Optional[DiskStringTable]]:
+    """読み取り専用モードでブックを開く（大きな共有文字列テーブルはディスクへ退避する）
+
+    退避した共有文字列テーブルはブックを閉じた後に呼び出し側でclose()すること。
+
+    Args:
+        filename: ファイルパスまたはストリーム
+        spill_bytes (int): ディスクへ退避する共有文字列XMLのサイズの閾値（0の場合は退避しない）
+        spill_dir (Optional[str]): 一時ファイルの作成先
+    Returns:
+        Tuple[object, Optional[DiskStringTable]]: (ブック, 退避した共有文字列テーブル。退避していない場合はNone)
+    """
+    reader = SpillingExcelReader(filename, spill_bytes=spill_bytes, spill_dir=spill_dir,
+                                 read_only=True, keep_vba=False, data_only=True, keep_links=True, rich_text=False)
+    try:
+        reader.read()
+    except Exception:
+        if reader.spilled_strings is not None:
+            reader.spilled_strings.close()
+        raise
+    return reader.wb, reader.spilled_strings
@@ -0,0 +1,153 @@
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._reader import WorkSheetParser
+from typing import Iterator, Optional
+
+class SheetStats:
+    """シートの宣言範囲と実データ範囲の統計情報クラス
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, declared: Optional[str] = None) -> None:
+        """コンストラクタ
+        Args:
+            declared (Optional[str]): 宣言されたシート範囲（例: A1:XFD1048576）。宣言がない場合はNone
+        """
+        self.declared = declared        # 宣言されたシート範囲
+        self.xml_rows = 0               # シートXMLに存在する行数（書式のみの行を含む）
+        self.value_rows = 0             # 値を持つセルがある行数
+        self.value_cells = 0            # 値を持つセル数
+        self.max_row = 0                # 値を持つセルの最大行番号
+        self.max_column = 0             # 値を持つセルの最大列番号
+
+    def __repr__(self) -> str:
+        """文字列表現
+        Returns:
+            str: 文字列表現
+        """
+        return (f'SheetStats(declared={self.declared!r}, used={self.used()!r}, xml_rows={self.xml_rows}, '
+                f'value_rows={self.value_rows}, value_cells={self.value_cells})')
+
+    #
+    # public methods
+    #
+    def used(self) -> Optional[str]:
+        """値を持つセルの範囲の取得
+        Returns:
+            Optional[str]: A1から値を持つセルの最大行・最大列までの範囲。値がない場合はNone
+        """
+        if self.value_cells == 0:
+            return None
+        return f'A1:{get_column_letter(self.max_column)}{self.max_row}'
+
+class SheetCellParser(WorkSheetParser):
+    """値を持つセルだけを解析するワークシート解析クラス
+
+    openpyxlのWorkSheetParserを元に、値（v要素またはインライン文字列）を持たないセルは解析せず、
+    書式のみの行の行情報も保持しない。
+    openpyxlの非公開APIに依存するため、openpyxlは3.1系に固定している（pyproject.toml）。
+    """
+    #
+    # public methods
+    #
+    def parse_row(self, row):
+        """行要素の解析（値を持つセルのみ）
+        Args:
+            row: 行要素
+        Returns:
+            tuple: (行番号, セル情報のリスト)
+        """
+        r = row.get('r')
+        if r is not None:
+            try:
+                self.row_counter = int(r)
+            except ValueError:
+                # openpyxlと同様に整数でない行番号はエラーとする
+                value = float(r)
+                if not value.is_integer():
+                    raise ValueError(f"{r} is not a valid row number")
+                self.row_counter = int(value)
+        else:
+            self.row_counter += 1
+        self.col_counter = 0
+
+        cells = []
+        for element in row:
+            # 子要素（v, f, is）がないセルは書式のみなので解析しない
+            if len(element) == 0:
+                if element.get('r') is None:
+                    self.col_counter += 1
+                continue
+            cells.append(self.parse_cell(element))
+        return self.row_counter, cells
+
+class SheetCellReader:
+    """ワークシートのセル値読み込みクラス
+
+    宣言されたシート範囲（dimension要素）や書式のみの行に関係なく、シートXMLに実在する値だけを返す。
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, worksheet, declared: Optional[str] = None) -> None:
+        """コンストラクタ
+        Args:
+            worksheet: 読み取り専用モードで開いたワークシート（openpyxlのReadOnlyWorksheet）
+            declared (Optional[str]): カタログ情報から取得した宣言されたシート範囲（Noneの場合はワークシートから取得）
+        """
+        self._worksheet = worksheet
+        self.stats = SheetStats(declared if declared else self._declared_dimension(worksheet))
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # public methods
+    #
+    def iter_values(self) -> Iterator[object]:
+        """値を持つセルの値を順番に返す
+        Returns:
+            Iterator[object]: セルの値（Noneおよび空文字は返さない）
+        """
+        workbook = self._worksheet.parent
+        stats = self.stats
+        with self._worksheet._get_source() as src:
+            parser = SheetCellParser(src,
+                                     self._worksheet._shared_strings,
+                                     data_only=workbook.data_only,
+                                     epoch=workbook.epoch,
+                                     date_formats=workbook._date_formats,
+                                     timedelta_formats=workbook._timedelta_formats)
+            for row_index, cells in parser.parse():
+                stats.xml_rows += 1
+                has_value = False
+                for cell in cells:
+                    value = cell['value']
+                    if value is None or value == "":
+                        continue
+                    has_value = True
+                    stats.value_cells += 1
+                    if cell['column'] > stats.max_column:
+                        stats.max_column = cell['column']
+                    yield value
+                if has_value:
+                    stats.value_rows += 1
+                    stats.max_row = max(stats.max_row, row_index)
+
+    #
+    # protected methods
+    #
+    @staticmethod
+    def _declared_dimension(worksheet) -> Optional[str]:
+        """宣言されたシート範囲の取得
+        Args:
+            worksheet: 読み取り専用モードで開いたワークシート
+        Returns:
+            Optional[str]: シート範囲（例: A1:D10）。宣言がない場合はNone
+        """
+        if not worksheet.max_row or not worksheet.max_column:
+            return None
+        return (f'{get_column_letter(worksheet.min_column)}{worksheet.min_row}:'
+                f'{get_column_letter(worksheet.max_column)}{worksheet.max_row}')
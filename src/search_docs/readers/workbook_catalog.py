@@ -0,0 +1,243 @@
+from openpyxl.utils.cell import range_boundaries
+from search_docs.readers.archive_reader import ArchiveReader
+from typing import Dict, List, Optional
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+
+class SheetCatalog:
+    """シートのカタログ情報クラス
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, name: str, part: str, xml_size: int, has_drawing: bool, dimension: Optional[str]) -> None:
+        """コンストラクタ
+        Args:
+            name (str): シート名
+            part (str): シートXMLのパーツ名（例: xl/worksheets/sheet1.xml）
+            xml_size (int): シートXMLの展開後サイズ
+            has_drawing (bool): 図形（drawing, vmlDrawing）の有無
+            dimension (Optional[str]): 宣言されたシート範囲（例: A1:D10）。宣言がない場合はNone
+        """
+        self.name = name
+        self.part = part
+        self.xml_size = xml_size
+        self.has_drawing = has_drawing
+        self.dimension = dimension
+
+    #
+    # public methods
+    #
+    def declared_cells(self) -> int:
+        """宣言されたシート範囲のセル数
+        Returns:
+            int: 宣言されたシート範囲のセル数（宣言がない、または解釈できない場合は0）
+        """
+        if not self.dimension:
+            return 0
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(self.dimension)
+        except (TypeError, ValueError):
+            return 0
+        if None in (min_col, min_row, max_col, max_row):
+            return 0
+        return (max_col - min_col + 1) * (max_row - min_row + 1)
+
+class BookCatalog:
+    """ブックのカタログ情報クラス
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, source: str, sheets: List[SheetCatalog], shared_strings_size: int = 0) -> None:
+        """コンストラクタ
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+            sheets (List[SheetCatalog]): シートのカタログ情報リスト（ブック内の並び順）
+            shared_strings_size (int): 共有文字列テーブルXMLの展開後サイズ
+        """
+        self.source = source
+        self.sheets = sheets
+        self.shared_strings_size = shared_strings_size
+
+    #
+    # public methods
+    #
+    def cost(self) -> int:
+        """検索コストの見積もり
+        Returns:
+            int: 解析が必要なXMLの展開後サイズの合計（バイト）
+        """
+        return sum(sheet.xml_size for sheet in self.sheets) + self.shared_strings_size
+
+class WorkbookCatalog:
+    """ワークブックカタログ読み込みクラス
+
+    ZIPの中央ディレクトリとxl/workbook.xml（および関連する.rels）だけを読み込み、
+    ブックを開かずにシート名、シートXMLサイズ、図形の有無、宣言されたシート範囲を取得する。
+    """
+    DIMENSION_READ_BYTES: int = 64 * 1024       # シート範囲の取得で読み込むシートXML先頭のバイト数
+
+    _RELS_TYPE_OFFICE_DOCUMENT = '/officeDocument'
+    _RELS_TYPE_SHARED_STRINGS = '/sharedStrings'
+    _RELS_TYPE_DRAWINGS = ('/drawing', '/vmlDrawing')
+    _DIMENSION_PATTERN = re.compile(rb'<(?:\w+:)?dimension\s[^>]*?ref="([^"]*)"')
+    _SHEET_DATA_PATTERN = re.compile(rb'<(?:\w+:)?sheetData[\s>/]')
+
+    #
+    # constructor/destructor
+    #
+    def __init__(self, archive_reader: ArchiveReader) -> None:
+        """コンストラクタ
+        Args:
+            archive_reader (ArchiveReader): ドキュメントの読み込みに使用するアーカイブ読み込みオブジェクト
+        """
+        self._archive_reader = archive_reader
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # public methods
+    #
+    def read(self, source: str) -> BookCatalog:
+        """カタログ情報の読み込み
+
+        ブックとして読み込めない場合は例外を送出する。
+
+        Args:
+            source (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            BookCatalog: ブックのカタログ情報
+        """
+        with self._archive_reader.open(source) as stream:
+            with zipfile.ZipFile(stream) as archive:
+                sizes = {info.filename: info.file_size for info in archive.infolist()}
+                # ルートの.relsからワークブックのパーツ名を取得
+                workbook_part = 'xl/workbook.xml'
+                for _, rel_type, target in self._read_rels(archive, sizes, '_rels/.rels', ''):
+                    if rel_type.endswith(self._RELS_TYPE_OFFICE_DOCUMENT):
+                        workbook_part = target
+                        break
+                # ワークブックの.relsを取得
+                workbook_dir = posixpath.dirname(workbook_part)
+                workbook_rels_part = posixpath.join(workbook_dir, '_rels', posixpath.basename(workbook_part) + '.rels')
+                workbook_rels: Dict[str, tuple] = {}
+                shared_strings_size = 0
+                for rel_id, rel_type, target in self._read_rels(archive, sizes, workbook_rels_part, workbook_dir):
+                    workbook_rels[rel_id] = (rel_type, target)
+                    if rel_type.endswith(self._RELS_TYPE_SHARED_STRINGS):
+                        shared_strings_size = sizes.get(target, 0)
+
+                # ワークブックXMLからシート一覧を取得
+                sheets: List[SheetCatalog] = []
+                root = ET.fromstring(archive.read(workbook_part))
+                for element in root.iter():
+                    if self._local_name(element.tag) != 'sheet':
+                        continue
+                    rel_id = self._get_rel_id(element)
+                    if rel_id not in workbook_rels:
+                        continue
+                    _, part = workbook_rels[rel_id]
+                    # パーツが存在しないシートは除外（openpyxlのシート一覧と合わせる）
+                    if part not in sizes:
+                        continue
+                    sheets.append(SheetCatalog(
+                        name=element.get('name', ''),
+                        part=part,
+                        xml_size=sizes[part],
+                        has_drawing=self._has_drawing(archive, sizes, part),
+                        dimension=self._read_dimension(archive, part),
+                    ))
+                return BookCatalog(source, sheets, shared_strings_size)
+
+    #
+    # protected methods
+    #
+    def _read_rels(self, archive: zipfile.ZipFile, sizes: dict, rels_part: str, base_dir: str) -> List[tuple]:
+        """.relsの読み込み
+        Args:
+            archive (zipfile.ZipFile): ブックのZIP
+            sizes (dict): パーツ名とサイズの辞書
+            rels_part (str): .relsのパーツ名
+            base_dir (str): 相対パスの基準フォルダ
+        Returns:
+            List[tuple]: (Id, Type, パーツ名)のリスト
+        """
+        rels = []
+        if rels_part not in sizes:
+            return rels
+        root = ET.fromstring(archive.read(rels_part))
+        for element in root:
+            if self._local_name(element.tag) != 'Relationship':
+                continue
+            # 外部参照は対象外
+            if element.get('TargetMode') == 'External':
+                continue
+            target = element.get('Target', '')
+            if target.startswith('/'):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(base_dir, target))
+            rels.append((element.get('Id', ''), element.get('Type', ''), target))
+        return rels
+
+    def _has_drawing(self, archive: zipfile.ZipFile, sizes: dict, part: str) -> bool:
+        """シートの図形有無の判定
+        Args:
+            archive (zipfile.ZipFile): ブックのZIP
+            sizes (dict): パーツ名とサイズの辞書
+            part (str): シートXMLのパーツ名
+        Returns:
+            bool: 図形（drawing, vmlDrawing）がある場合はTrue
+        """
+        part_dir = posixpath.dirname(part)
+        rels_part = posixpath.join(part_dir, '_rels', posixpath.basename(part) + '.rels')
+        for _, rel_type, _ in self._read_rels(archive, sizes, rels_part, part_dir):
+            if rel_type.endswith(self._RELS_TYPE_DRAWINGS):
+                return True
+        return False
+
+    def _read_dimension(self, archive: zipfile.ZipFile, part: str) -> Optional[str]:
+        """宣言されたシート範囲の取得（シートXMLの先頭のみ読み込む）
+        Args:
+            archive (zipfile.ZipFile): ブックのZIP
+            part (str): シートXMLのパーツ名
+        Returns:
+            Optional[str]: シート範囲（例: A1:D10）。宣言がない場合はNone
+        """
+        with archive.open(part) as f:
+            head = f.read(self.DIMENSION_READ_BYTES)
+        # dimensionはsheetDataより前に宣言される
+        data_match = self._SHEET_DATA_PATTERN.search(head)
+        if data_match:
+            head = head[:data_match.start()]
+        match = self._DIMENSION_PATTERN.search(head)
+        return match.group(1).decode('utf-8') if match else None
+
+    @staticmethod
+    def _get_rel_id(element: ET.Element) -> Optional[str]:
+        """sheet要素のr:id属性の取得
+        Args:
+            element (ET.Element): sheet要素
+        Returns:
+            Optional[str]: r:id属性の値
+        """
+        for key, value in element.attrib.items():
+            if key.endswith('}id'):
+                return value
+        return None
+
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        """名前空間を除いたタグ名の取得
+        Args:
+            tag (str): タグ名
+        Returns:
+            str: 名前空間を除いたタグ名
+        """
+        return tag.rsplit('}', 1)[-1]
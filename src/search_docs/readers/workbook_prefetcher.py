@@ -0,0 +1,244 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import BinaryIO, Callable, Deque, Iterator, List, Optional, Tuple
+import io
+import os
+import threading
+import time
+
+class PrefetchMetrics:
+    """先読み処理の計測情報クラス
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self) -> None:
+        """コンストラクタ
+        """
+        self.io_wait_sec: float = 0.0     # 消費側が読み込み完了を待った時間(秒)
+        self.read_sec: float = 0.0        # 読み込みスレッドでの読み込み時間の合計(秒)
+        self.parse_sec: float = 0.0       # 消費側での解析時間の合計(秒)
+        self.read_bytes: int = 0          # 読み込んだバイト数の合計
+        self.read_count: int = 0          # 読み込んだファイル数
+        self.error_count: int = 0         # 読み込みに失敗したファイル数
+        self.direct_count: int = 0        # 先読みせずに直接開いたファイル数
+
+    #
+    # public methods
+    #
+    def merge(self, other: 'PrefetchMetrics') -> None:
+        """計測情報の加算
+        Args:
+            other (PrefetchMetrics): 加算する計測情報
+        """
+        self.io_wait_sec += other.io_wait_sec
+        self.read_sec += other.read_sec
+        self.parse_sec += other.parse_sec
+        self.read_bytes += other.read_bytes
+        self.read_count += other.read_count
+        self.error_count += other.error_count
+        self.direct_count += other.direct_count
+
+    def to_dict(self) -> dict:
+        """計測情報を辞書で取得
+        Returns:
+            dict: 計測情報の辞書
+        """
+        return {
+            'io_wait_sec': round(self.io_wait_sec, 3),
+            'read_sec': round(self.read_sec, 3),
+            'parse_sec': round(self.parse_sec, 3),
+            'read_bytes': self.read_bytes,
+            'read_count': self.read_count,
+            'error_count': self.error_count,
+            'direct_count': self.direct_count,
+        }
+
+class WorkbookPrefetcher:
+    """ワークブック先読みクラス
+
+    読み込みスレッドで次のK件のファイルをメモリバッファへ先読みし、
+    消費側が現在のブックを解析している間にネットワークI/Oを進める。
+    先読み中のバッファ合計は指定バイト数以内に抑える。
+    先読みしない場合とバッファ上限を超えるファイルは、メモリに読み込まずに順番が来たときにストリームを直接開く。
+    """
+    #
+    # constructor/destructor
+    #
+    def __init__(self, sources: List[str], prefetch_count: int = 2, buffer_bytes: int = 256 * 1024 * 1024,
+                 loader: Optional[Callable[[str], bytes]] = None, sizer: Optional[Callable[[str], int]] = None,
+                 opener: Optional[Callable[[str], BinaryIO]] = None) -> None:
+        """コンストラクタ
+        Args:
+            sources (List[str]): 読み込み対象のリスト（フルパス）
+            prefetch_count (int): 先読み件数(0の場合は先読みせず逐次読み込み)
+            buffer_bytes (int): 先読みバッファの上限バイト数
+            loader (Optional[Callable[[str], bytes]]): 読み込み関数（Noneの場合はファイルを読み込む）
+            sizer (Optional[Callable[[str], int]]): サイズ見積もり関数（Noneの場合はファイルサイズ）
+            opener (Optional[Callable[[str], BinaryIO]]): 先読みしないファイルのストリームを開く関数（Noneの場合はファイルを開く）
+        """
+        self._sources = list(sources)
+        self._prefetch_count = max(0, int(prefetch_count))
+        self._buffer_bytes = max(0, int(buffer_bytes))
+        self._loader = loader if loader else self._read_file
+        self._sizer = sizer if sizer else self._file_size
+        self._opener = opener if opener else self._open_file
+        self.metrics = PrefetchMetrics()
+        self._lock = threading.Lock()
+
+    def __del__(self) -> None:
+        """デストラクタ
+        """
+        pass
+
+    #
+    # public methods
+    #
+    def __iter__(self) -> Iterator[Tuple[str, Optional[BinaryIO]]]:
+        """先読み済みバッファまたは直接開いたストリームを順番に返す
+
+        直接開いたストリームは次の要素を要求された時点で閉じる。
+
+        Returns:
+            Iterator[Tuple[str, Optional[BinaryIO]]]: (読み込み対象, シーク可能なストリーム)。読み込みに失敗した場合のストリームはNone
+        """
+        # 先読みしない場合は順番に直接開く
+        if self._prefetch_count == 0:
+            for source in self._sources:
+                yield from self._iter_direct(source)
+            return
+
+        pending: Deque[Tuple[str, int, Future]] = deque()
+        pending_bytes = 0
+        next_index = 0
+        executor = ThreadPoolExecutor(max_workers=self._prefetch_count, thread_name_prefix='prefetch')
+        try:
+            while True:
+                # 先読み件数とバッファ上限の範囲で読み込みを投入
+                while next_index < len(self._sources) and len(pending) < self._prefetch_count:
+                    source = self._sources[next_index]
+                    size = self._sizer(source)
+                    # バッファ上限を超えるファイルは先読みせず、順番が来たときに直接開く
+                    if size > self._buffer_bytes:
+                        pending.append((source, 0, None))
+                        next_index += 1
+                        continue
+                    if pending and pending_bytes + size > self._buffer_bytes:
+                        break
+                    pending.append((source, size, executor.submit(self._load, source)))
+                    pending_bytes += size
+                    next_index += 1
+
+                # すべて消費済みの場合は終了
+                if not pending:
+                    break
+
+                # 先頭の読み込み完了を待つ
+                source, size, future = pending.popleft()
+                if future is None:
+                    yield from self._iter_direct(source)
+                    continue
+                start = time.perf_counter()
+                data = future.result()
+                self.metrics.io_wait_sec += time.perf_counter() - start
+                pending_bytes -= size
+                yield source, self._to_buffer(data)
+        finally:
+            # 途中で中断された場合は未着手の読み込みを取り消す
+            for _, _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    #
+    # protected methods
+    #
+    def _iter_direct(self, source: str) -> Iterator[Tuple[str, Optional[BinaryIO]]]:
+        """先読みせずにストリームを直接開いて返す（次の要素を要求された時点で閉じる）
+        Args:
+            source (str): 読み込み対象
+        Returns:
+            Iterator[Tuple[str, Optional[BinaryIO]]]: (読み込み対象, ストリーム)。開けなかった場合のストリームはNone
+        """
+        start = time.perf_counter()
+        try:
+            stream = self._opener(source)
+        except Exception:
+            stream = None
+        self.metrics.io_wait_sec += time.perf_counter() - start
+        with self._lock:
+            if stream is None:
+                self.metrics.error_count += 1
+            else:
+                self.metrics.direct_count += 1
+        try:
+            yield source, stream
+        finally:
+            if stream is not None:
+                stream.close()
+
+    def _load(self, source: str) -> Optional[bytes]:
+        """読み込み処理（読み込みスレッドで実行）
+        Args:
+            source (str): 読み込み対象
+        Returns:
+            Optional[bytes]: 読み込んだデータ。失敗した場合はNone
+        """
+        start = time.perf_counter()
+        try:
+            data = self._loader(source)
+        except Exception:
+            data = None
+        elapsed = time.perf_counter() - start
+        # 計測情報を更新（読み込みスレッドから並行して呼ばれるためロックする）
+        with self._lock:
+            self.metrics.read_sec += elapsed
+            if data is None:
+                self.metrics.error_count += 1
+            else:
+                self.metrics.read_bytes += len(data)
+                self.metrics.read_count += 1
+        return data
+
+    @staticmethod
+    def _to_buffer(data: Optional[bytes]) -> Optional[io.BytesIO]:
+        """読み込んだデータをバッファに変換
+        Args:
+            data (Optional[bytes]): 読み込んだデータ
+        Returns:
+            Optional[io.BytesIO]: バッファ。データがない場合はNone
+        """
+        return io.BytesIO(data) if data is not None else None
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        """ファイル読み込み
+        Args:
+            path (str): ファイルパス
+        Returns:
+            bytes: ファイルの内容
+        """
+        with open(path, 'rb') as f:
+            return f.read()
+
+    @staticmethod
+    def _open_file(path: str) -> BinaryIO:
+        """ファイルを開く
+        Args:
+            path (str): ファイルパス
+        Returns:
+            BinaryIO: ファイルのストリーム
+        """
+        return open(path, 'rb')
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """ファイルサイズ取得
+        Args:
+            path (str): ファイルパス
+        Returns:
+            int: ファイルサイズ（取得できない場合は0）
+        """
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
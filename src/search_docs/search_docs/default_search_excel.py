@@ -1,11 +1,14 @@
-from  search_docs.interfaces import AbstractSearchDocs
-import pandas as pd
-import openpyxl
-import win32com.client
+from  search_docs.interfaces import AbstractSearchDocs, SheetResult
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="openpyxl")
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
 from bteam_utils import CommonProgress
+from search_docs.readers import WorkbookPrefetcher, PrefetchMetrics, ArchiveReader, WorkbookCatalog, BookCatalog, SheetCatalog, SheetCellReader
+from search_docs.readers import load_workbook
+from search_docs.matchers import KeywordMatcher
 
 class DefaultSearchExcel(AbstractSearchDocs):
     """Excelドキュメント検索クラス
@@ -16,10 +19,43 @@ class DefaultSearchExcel(AbstractSearchDocs):
     #
     # constructor/destructor
     #
-    def __init__(self, enable_progress: bool = True) -> None:
+    def __init__(self, enable_progress: bool = True, prefetch_count: int = 2, prefetch_buffer_bytes: int = 256 * 1024 * 1024,
+                 archive_max_depth: int = 0, archive_encoding: str = None, shared_strings_spill_bytes: int = 0,
+                 match_normalize: bool = False, match_kana: bool = False, match_ignore_case: bool = False,
+                 match_regex: bool = False, match_cache_size: int = 262144,
+                 archive_cache_bytes: int = 256 * 1024 * 1024) -> None:
         """コンストラクタ
+        Args:
+            enable_progress (bool): 進捗表示有無フラグ
+            prefetch_count (int): ブックの先読み件数(0の場合は先読みしない)
+            prefetch_buffer_bytes (int): 先読みバッファの上限バイト数
+            archive_max_depth (int): ZIPアーカイブを辿る最大の深さ(0の場合はアーカイブ内を検索しない)
+            archive_encoding (str): UTF-8フラグのないZIPメンバー名の文字コード
+            shared_strings_spill_bytes (int): 共有文字列テーブルをディスクへ退避するサイズの閾値(0の場合は退避しない)
+            match_normalize (bool): キーワード照合時にNFKC正規化（全角/半角の統一など）を行うかどうか
+            match_kana (bool): キーワード照合時にひらがなとカタカナを区別しないかどうか
+            match_ignore_case (bool): キーワード照合時に大文字と小文字を区別しないかどうか
+            match_regex (bool): 「re:」で始まるキーワードを正規表現として扱うかどうか
+            match_cache_size (int): キーワード照合結果をキャッシュする文字列数(0の場合はキャッシュしない)
+            archive_cache_bytes (int): 展開した入れ子のZIPアーカイブをメモリにキャッシュする上限バイト数(上限を超えるアーカイブは一時ファイルに展開する)
         """
         super().__init__(enable_progress)
+        self._prefetch_count = prefetch_count
+        self._prefetch_buffer_bytes = prefetch_buffer_bytes
+        self._shared_strings_spill_bytes = shared_strings_spill_bytes
+        self._match_options = {
+            'normalize': match_normalize,
+            'kana': match_kana,
+            'ignore_case': match_ignore_case,
+            'enable_regex': match_regex,
+            'cache_size': match_cache_size,
+        }
+        self._metrics = PrefetchMetrics()
+        self._archive_reader = ArchiveReader(self._extensions, max_depth=archive_max_depth, encoding=archive_encoding,
+                                             cache_bytes=archive_cache_bytes)
+        self._catalog_reader = WorkbookCatalog(self._archive_reader)
+        self._catalogs = {}     # ブックごとのカタログ情報（キーはファイルパスまたは「アーカイブパス::メンバーパス」）
+        self._elements = []     # 要素検索結果（シート単位の検索結果リスト）
 
     def __del__(self) -> None:
         """デストラクタ
@@ -37,19 +73,13 @@ class DefaultSearchExcel(AbstractSearchDocs):
         Returns:
             bool: True:成功, False:失敗
         """
-        # 初期化
-        excel_files = []
-
-        # フォルダ内のexcelファイルリストを取得
-        for root, dirs, files in os.walk(target_path):
-            for file in files:
-                # 拡張子がExcelファイルの場合
-                if file.endswith(tuple(self._extensions)):
-                    excel_files.append(os.path.join(root, file))
-
-        # excelファイルがある場合はシート名リストを取得
-        if len(excel_files) > 0:
-            self._search_sheet_list(excel_files)
+        # フォルダ内のexcelファイルのシート名リストを取得（ブックが開けることを確認し、開けないブックは「Bad File Error」とする）
+        # iter_results(keywords=None)と同じ処理で確認するため、両者の結果は一致する
+        elements = self._iter_keyword_results(self._search_sheet_list(self._list_files(target_path)), [])
+        self._elements = sorted(elements, key=lambda result: result.index)
+        self._results = None
+        self._pd_element = SheetResult.to_frame(self._elements)
+        self._pd_keyword = None
 
         # 検索結果に行が存在する場合はTrueを返す
         if not self._pd_element.empty:
@@ -73,291 +103,483 @@ class DefaultSearchExcel(AbstractSearchDocs):
         if not keywords or len(keywords) == 0:
             return False
         # 要素検索結果がない場合は終了
-        if self._pd_element is None or self._pd_element.empty:
+        if not self._elements:
             return False
-        
-        # キーワード検索結果を要素検索結果で初期化
-        self._pd_keyword = self._pd_element.copy(deep=True)
-        # キーワード列を追加
-        for keyword in keywords:
-            self._pd_keyword[keyword] = None
-
-        # CELL内テキスト検索を実行
-        self._search_keyword_cell(keywords)
-
-        # 図形内テキスト検索を実行
-        if enable_search_shapes:
-            self._search_keyword_shape(keywords)
-        
+
+        # CELL内および図形内テキスト検索を実行し、要素検索結果の並び順でデータフレームに変換
+        results = sorted(self._iter_keyword_results(self._elements, keywords, enable_search_shapes), key=lambda result: result.index)
+        self._pd_keyword = SheetResult.to_frame(results, keywords)
+
         # キーワード検索結果に行が存在する場合はTrueを返す
         if self._pd_keyword is not None and not self._pd_keyword.empty:
             return True
         else:
             return False
-        
+
+    def iter_results(self, target_path:str, keywords:Optional[list] = None, enable_search_shapes:bool = False,
+                     cancel_event=None) -> Iterator[SheetResult]:
+        """シート単位の検索結果を順次返す
+
+        ブックの検索が終わるごとにそのブックのシートの結果を返す（コストの大きいブックから検索するため、
+        返す順序は要素検索結果の並び順とは異なる。並び順はSheetResult.indexを参照）。
+
+        Args:
+            target_path (str): 検索対象パス
+            keywords (Optional[list]): 検索キーワード（Noneまたは空の場合は要素検索のみ実行）
+            enable_search_shapes (bool): 図形内テキスト検索有効フラグ
+            cancel_event: 中断要求（is_set()がTrueになると次のブックを検索せずに終了する。threading.Eventなど）
+
+        Returns:
+            Iterator[SheetResult]: シート単位の検索結果
+        """
+        # シート名リストを取得
+        elements = self._search_sheet_list(self._list_files(target_path), cancel_event)
+        # キーワードがない場合はブックが開けることを確認して要素検索結果を返す
+        if not keywords:
+            yield from self._iter_keyword_results(elements, [], cancel_event=cancel_event)
+            return
+        # キーワード検索結果を返す
+        yield from self._iter_keyword_results(elements, keywords, enable_search_shapes, cancel_event)
+
+    def get_metrics(self) -> dict:
+        """I/O計測情報取得
+        Returns:
+            dict: 読み込み待ち時間と解析時間などの計測情報
+        """
+        return self._metrics.to_dict()
+
+    def get_plan(self, target_path:str) -> list:
+        """検索計画取得
+
+        カタログ情報だけを読み込んで見積もる（ブックは開かない）。
+        そのため、カタログ情報は読めてもopenpyxlで開けないブックも計画に含まれる
+        （search_element, iter_resultsではこのようなブックは「Bad File Error」となる）。
+
+        Args:
+            target_path (str): 検索対象パス
+
+        Returns:
+            list: ブックごとの見積もり情報（Path, Book, Sheets, Drawings, Cells, Cost）のリスト。検索する順（コストの大きい順）に並ぶ。
+                Cellsは宣言されたシート範囲のセル数の合計
+        """
+        self._search_sheet_list(self._list_files(target_path))
+        plan = []
+        for file in self._schedule(list(self._catalogs.keys())):
+            file_path, file_name = ArchiveReader.split(file)
+            book_catalog = self._catalogs[file]
+            plan.append({
+                'Path': file_path,
+                'Book': file_name,
+                'Sheets': len(book_catalog.sheets),
+                'Drawings': sum(1 for sheet in book_catalog.sheets if sheet.has_drawing),
+                'Cells': sum(sheet.declared_cells() for sheet in book_catalog.sheets),
+                'Cost': book_catalog.cost(),
+            })
+        return plan
+
     #
     # protected methods
     #
-    def _search_sheet_list(self, files:list) -> None:
+    def _list_files(self, target_path:str) -> list:
+        """検索対象ファイルリスト取得
+        Args:
+            target_path (str): 検索対象パス
+        Returns:
+            list: excelファイルのリスト（フルパスまたは「アーカイブパス::メンバーパス」形式）
         """
-        シート名リスト取得
+        # 初期化
+        excel_files = []
+
+        # フォルダ内のexcelファイルリストを取得
+        for root, dirs, files in os.walk(target_path):
+            for file in files:
+                # 拡張子がExcelファイルの場合
+                if file.endswith(tuple(self._extensions)):
+                    excel_files.append(os.path.join(root, file))
+                # ZIPアーカイブの場合はアーカイブ内のExcelファイルを展開せずに登録
+                elif self._archive_reader.is_enabled() and ArchiveReader.is_archive(file):
+                    excel_files.extend(self._archive_reader.walk(os.path.join(root, file)))
+        return excel_files
+
+    def _create_prefetcher(self, files:list) -> WorkbookPrefetcher:
+        """ブック先読みオブジェクト生成
         Args:
             files (list): excelファイルのリスト（フルパス）
+        Returns:
+            WorkbookPrefetcher: ブック先読みオブジェクト
+        """
+        return WorkbookPrefetcher(files, prefetch_count=self._prefetch_count, buffer_bytes=self._prefetch_buffer_bytes,
+                                  loader=self._archive_reader.read, sizer=self._archive_reader.size,
+                                  opener=self._archive_reader.open)
+
+    def _read_catalog(self, file:str) -> BookCatalog:
+        """カタログ情報の読み込み（読み込みスレッドで実行）
+        Args:
+            file (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            BookCatalog: ブックのカタログ情報。ブックとして読み込めない場合はNone
+        """
+        try:
+            return self._catalog_reader.read(file)
+        except Exception:
+            return None
+
+    def _get_cost(self, file:str) -> int:
+        """ブックの検索コスト取得
+        Args:
+            file (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+        Returns:
+            int: 検索コスト（カタログ情報がない場合はファイルサイズ）
+        """
+        book_catalog = self._catalogs.get(file)
+        return book_catalog.cost() if book_catalog is not None else self._archive_reader.size(file)
+
+    def _schedule(self, files:list) -> list:
+        """検索順の決定（コストの大きいブックから検索して終盤の待ち時間を減らす）
+        Args:
+            files (list): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列のリスト
+        Returns:
+            list: 検索順に並べたリスト
+        """
+        return sorted(files, key=self._get_cost, reverse=True)
+
+    def _get_sheet_catalog(self, path:str, book:str, sheetname:str) -> Optional[SheetCatalog]:
+        """シートのカタログ情報取得
+        Args:
+            path (str): Path列の値
+            book (str): Book列の値
+            sheetname (str): シート名
+        Returns:
+            Optional[SheetCatalog]: シートのカタログ情報。カタログ情報がない場合はNone
+        """
+        book_catalog = self._catalogs.get(ArchiveReader.join(path, book))
+        if book_catalog is None:
+            return None
+        for sheet in book_catalog.sheets:
+            if sheet.name == sheetname:
+                return sheet
+        return None
+
+    def _has_drawing(self, path:str, book:str, sheetname:str) -> bool:
+        """シートの図形有無の判定
+        Args:
+            path (str): Path列の値
+            book (str): Book列の値
+            sheetname (str): シート名
+        Returns:
+            bool: 図形がある場合、またはカタログ情報がなく判定できない場合はTrue
+        """
+        sheet_catalog = self._get_sheet_catalog(path, book, sheetname)
+        return sheet_catalog.has_drawing if sheet_catalog is not None else True
+
+    @staticmethod
+    def _format_eta(done_cost:int, total_cost:int, start:float) -> str:
+        """残り時間の表示文字列生成
+        Args:
+            done_cost (int): 処理済みのコスト
+            total_cost (int): 全体のコスト
+            start (float): 処理開始時刻(time.perf_counter)
+        Returns:
+            str: 残り時間の表示文字列（見積もれない場合は空文字）
+        """
+        if done_cost <= 0 or total_cost <= 0:
+            return ''
+        elapsed = time.perf_counter() - start
+        remaining = int(elapsed * max(0, total_cost - done_cost) / done_cost)
+        return f' ETA {remaining // 60:02d}:{remaining % 60:02d}'
+
+    @staticmethod
+    def _is_cancelled(cancel_event) -> bool:
+        """中断要求の判定
+        Args:
+            cancel_event: 中断要求（Noneの場合は中断しない）
+        Returns:
+            bool: 中断要求がある場合はTrue
+        """
+        return cancel_event is not None and cancel_event.is_set()
+
+    def _search_sheet_list(self, files:list, cancel_event=None) -> List[SheetResult]:
+        """
+        シート名リスト取得
+        Args:
+            files (list): excelファイルのリスト（フルパスまたは「アーカイブパス::メンバーパス」形式）
+            cancel_event: 中断要求（Noneの場合は中断しない）
+        Returns:
+            List[SheetResult]: シート単位の要素検索結果リスト
         """
 
         # 初期化
         progress_max = len(files)
-        rows = []
-        workbook = None
+        elements = []
+        self._catalogs = {}
         # 進捗表示用を初期化
         progress = CommonProgress(total=progress_max, task_msg=self._doc_type+' Sheets') if self._enable_progress else None
 
-        # ファイルごとにシート名を取得
-        for i, file in enumerate(files, 1):
-            file_path = os.path.dirname(file)
-            file_name = os.path.basename(file)
-            try:
-                # ブックを開く
-                workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
-                sheetnames = workbook.sheetnames
-                # ブック名とシート名をリストに登録
-                for sheetname in sheetnames:
-                    rows.append({
-                        'Path':file_path,
-                        'Book':file_name,
-                        'Sheet':sheetname
-                    })
-            except :
-                # ファイルが開けない場合はエラーメッセージを登録
-                rows.append({
-                    'Path':file_path,
-                    'Book':file_name,
-                    'Sheet':"Bad File Error"
-                })
-            finally:
-                # workbookを閉じる
-                if workbook is not None:
-                    workbook.close()
-                    workbook = None
-
-            # 進捗表示
-            if progress:
-                progress.update(current=i, status_msg=f'Processing: {i}/{progress_max}')
+        # ファイルごとにカタログ情報（シート名など）を取得（ブック全体は読み込まない）
+        executor = ThreadPoolExecutor(max_workers=max(1, self._prefetch_count), thread_name_prefix='catalog')
+        try:
+            for i, (file, book_catalog) in enumerate(zip(files, executor.map(self._read_catalog, files)), 1):
+                if self._is_cancelled(cancel_event):
+                    break
+                file_path, file_name = ArchiveReader.split(file)
+                if book_catalog is not None:
+                    self._catalogs[file] = book_catalog
+                    # ブック名とシート名をリストに登録
+                    for sheet in book_catalog.sheets:
+                        elements.append(SheetResult(len(elements), self._doc_type, file_path, file_name, sheet.name))
+                else:
+                    # ファイルが開けない場合はエラーメッセージを登録
+                    elements.append(SheetResult(len(elements), self._doc_type, file_path, file_name, "Bad File Error", error=True))
 
-        # 列名を設定（0を空文字に置換）
-        self._pd_element = pd.DataFrame(rows, columns=['Path','Book','Sheet']).replace(0, "")
+                # 進捗表示
+                if progress:
+                    progress.update(current=i, status_msg=f'Processing: {i}/{progress_max}')
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
         # 進捗表示(100%)
         if progress:
             progress.complete()
-    
-    def _search_keyword_cell(self, keywords:list) -> None:
-        """キーワード検索処理
+        return elements
+
+    def _iter_keyword_results(self, elements:List[SheetResult], keywords:list, enable_search_shapes:bool = False,
+                              cancel_event=None) -> Iterator[SheetResult]:
+        """キーワード検索処理（ブックごとに結果を返す）
+
+        カタログ情報を取得できても開けないブックは、シートごとの結果の代わりに「Bad File Error」の結果を1件返す。
+
         Args:
-            keywords (list): 検索キーワードリスト
+            elements (List[SheetResult]): 要素検索結果リスト
+            keywords (list): 検索キーワードリスト（空の場合はブックが開けることだけを確認する）
+            enable_search_shapes (bool): 図形内テキスト検索有効フラグ
+            cancel_event: 中断要求（Noneの場合は中断しない）
+        Returns:
+            Iterator[SheetResult]: シート単位のキーワード検索結果
         """
         # 進捗データ初期化
         progress_cnt = 0
-        progress_max = self._pd_keyword.shape[0]
-        workbook= None
-        current_workbook_path = None
+        progress_max = len(elements)
+        workbook = None
+        excel = None
+        if not keywords:
+            task_msg = ' Books'
+        else:
+            task_msg = ' Keyword in Cells and Shapes' if enable_search_shapes else ' Keyword in Cells'
         # 進捗表示用フラグを初期化
-        progress = CommonProgress(total=progress_max, task_msg=self._doc_type+' Keyword in Cells') if self._enable_progress else None
-
-        # ブック＋シートでキーワードを検索する
-        for output_index, output_row in self._pd_keyword.iterrows():
-            # Bad Fileの場合はスキップ
-            if output_row['Sheet'] == "Bad File Error":
+        progress = CommonProgress(total=progress_max, task_msg=self._doc_type+task_msg) if self._enable_progress else None
+        # 検索キーワードをまとめてコンパイル（照合結果は検索全体で文字列ごとにキャッシュされる）
+        matcher = self._create_matcher(keywords)
+
+        # ブックごとに検索対象のシートをまとめる
+        book_results = {}
+        for element in elements:
+            result = SheetResult(element.index, element.doc_type, element.path, element.book, element.sheet, error=element.error)
+            # Bad Fileの場合は検索せずにそのまま返す
+            if result.error:
                 progress_cnt += 1
-                if progress:
-                    progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
+                yield result
                 continue
-            
-            # フルパスを生成してOpen済みか確認
-            full_workbook_path = os.path.join(output_row['Path'], output_row['Book'])
-            if current_workbook_path != full_workbook_path:
-                if workbook is not None:
-                    workbook.close()
-
-                current_workbook_path = full_workbook_path
+            book_results.setdefault(ArchiveReader.join(result.path, result.book), []).append(result)
+        if progress and progress_cnt > 0:
+            progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
+
+        # ブック＋シートでキーワードを検索する（コストの大きいブックから、次のブックを先読みしながら解析する）
+        schedule = self._schedule(list(book_results.keys()))
+        total_cost = sum(self._get_cost(path) for path in schedule)
+        done_cost = 0
+        scan_start = time.perf_counter()
+        prefetcher = self._create_prefetcher(schedule)
+        try:
+            for full_workbook_path, buffer in prefetcher:
+                if self._is_cancelled(cancel_event):
+                    return
+                results = book_results[full_workbook_path]
+                start = time.perf_counter()
+                shared_strings = None
+                opened = False
                 try:
-                    # ブックを開く
-                    workbook = openpyxl.load_workbook(current_workbook_path, read_only=True, data_only=True)
-                except:
-                    # ファイルが開けない場合はスキップ
-                    workbook = None
+                    try:
+                        # ブックを開く（大きな共有文字列テーブルはディスクへ退避する）
+                        if buffer is not None:
+                            workbook, shared_strings = load_workbook(buffer, spill_bytes=self._shared_strings_spill_bytes)
+                    except:
+                        # ファイルが開けない場合はスキップ
+                        workbook = None
 
-            # ブックが開けなかった場合はスキップ
-            if workbook is None:
-                progress_cnt += 1
+                    # ブックが開けなかった場合はスキップ
+                    opened = workbook is not None
+                    if opened and keywords:
+                        for result in results:
+                            try:
+                                self._search_keyword_cell(workbook[result.sheet], result, matcher)
+                            except:
+                                # シートが読み込めない場合はスキップ
+                                pass
+                finally:
+                    # workbookを閉じる
+                    if workbook is not None:
+                        workbook.close()
+                        workbook = None
+                    # 退避した共有文字列テーブルを解放
+                    if shared_strings is not None:
+                        shared_strings.close()
+                    prefetcher.metrics.parse_sec += time.perf_counter() - start
+
+                # ブックが開けなかった場合はシートごとの結果を「Bad File Error」の結果1件にまとめる
+                if not opened:
+                    results = [self._create_bad_file_result(results)]
+                # 図形内テキスト検索を実行
+                elif enable_search_shapes:
+                    excel = self._search_keyword_shape(excel, full_workbook_path, results, matcher)
+
+                # 進捗表示
+                done_cost += self._get_cost(full_workbook_path)
+                progress_cnt += len(book_results[full_workbook_path])
                 if progress:
-                    progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
-                continue
+                    progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}{self._format_eta(done_cost, total_cost, scan_start)}')
 
-            # シートを指定する
-            worksheet = workbook[output_row['Sheet']]
-
-            # キーワードカウント用辞書を初期化
-            keyword_counts = {keyword:0 for keyword in keywords}
-            # 既存のキーワードカウントを取得
-            for keyword in keywords:
-                val = self._pd_keyword.at[output_index, keyword]
-                if val is not None and val != "":
-                    keyword_counts[keyword] = val
-
-            # キーワードがシート内に含まれているかチェックする
-            for row in worksheet.iter_rows(values_only=True):
-                # セルごとにチェック
-                for cell in row:
-                    if cell is None:
-                        continue
-                    cell_str = str(cell)
-                    # キーワードごとにチェック
-                    for keyword in keywords:
-                        if keyword in cell_str:
-                            keyword_counts[keyword] += 1
-
-            # キーワードカウントをDataFrameに設定
-            for keyword, count in keyword_counts.items():
-                self._pd_keyword.at[output_index, keyword] = count
-
-            # 進捗表示
-            progress_cnt += 1
+                # ブックの検索結果を返す
+                yield from results
+        finally:
+            self._metrics.merge(prefetcher.metrics)
+            # Excelアプリケーションを終了
+            if excel is not None:
+                try:
+                    excel.Quit()
+                except:
+                    pass
+                del excel
+            # 進捗表示(100%)
             if progress:
-                progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
+                progress.complete()
+
+    def _create_bad_file_result(self, results:List[SheetResult]) -> SheetResult:
+        """開けないブックの検索結果の作成
+        Args:
+            results (List[SheetResult]): ブック内のシート単位の検索結果リスト
+        Returns:
+            SheetResult: 「Bad File Error」の検索結果（並び順はブックの先頭のシートと同じ）
+        """
+        first = results[0]
+        return SheetResult(first.index, first.doc_type, first.path, first.book, "Bad File Error", error=True)
 
-        # 0を空文字に置換
-        self._pd_keyword = self._pd_keyword.replace(0, "")
+    def _create_matcher(self, keywords:list) -> KeywordMatcher:
+        """キーワード照合オブジェクトの作成
+        Args:
+            keywords (list): 検索キーワードリスト
+        Returns:
+            KeywordMatcher: キーワード照合オブジェクト
+        """
+        return KeywordMatcher(keywords, **self._match_options)
 
-        # workbookを閉じる
-        if workbook is not None:
-            workbook.close()
+    def _search_keyword_cell(self, worksheet, result:SheetResult, matcher:KeywordMatcher) -> None:
+        """キーワード検索処理
 
-        # 進捗表示(100%)
-        if progress:
-            progress.complete()
-    
-    def _search_keyword_shape(self, keywords:list) -> None:
+        シートXMLに実在する値を持つセルだけを検索する（宣言されたシート範囲や書式のみの行は辿らない）
+
+        Args:
+            worksheet: ワークシートオブジェクト
+            result (SheetResult): 検索結果の設定先（キーワードごとの出現数と統計情報を設定する）
+            matcher (KeywordMatcher): キーワード照合オブジェクト
+        """
+        # キーワードカウント用辞書を初期化
+        keyword_counts = {keyword:0 for keyword in matcher.keywords}
+
+        # キーワードがシート内に含まれているかチェックする（宣言されたシート範囲はカタログ情報のものを使用）
+        sheet_catalog = self._get_sheet_catalog(result.path, result.book, result.sheet)
+        reader = SheetCellReader(worksheet, sheet_catalog.dimension if sheet_catalog is not None else None)
+        for cell in reader.iter_values():
+            # セルに含まれるキーワードをカウント
+            for keyword in matcher.match(str(cell)):
+                keyword_counts[keyword] += 1
+
+        # キーワードカウントと統計情報を設定
+        result.counts = keyword_counts
+        result.stats = reader.stats
+
+    def _search_keyword_shape(self, excel, full_workbook_path:str, results:List[SheetResult], matcher:KeywordMatcher):
         """キーワード検索
 
-        図形内のテキストにキーワードが含まれる箇所をカウントする
+        図形内のテキストにキーワードが含まれる箇所をカウントし、セル内の出現数に加算する
 
         Args:
-            keywords (list): 検索キーワードリスト
+            excel: Excelアプリケーション（Noneの場合は必要になった時点で起動する）
+            full_workbook_path (str): ファイルパスまたは「アーカイブパス::メンバーパス」形式の文字列
+            results (List[SheetResult]): ブック内のシート単位の検索結果リスト
+            matcher (KeywordMatcher): キーワード照合オブジェクト
+        Returns:
+            Excelアプリケーション（起動していない場合はNone）
         """
+        # アーカイブ内のブック（Excelで直接開けない）はスキップ
+        if ArchiveReader.is_archive_member(results[0].path):
+            return excel
+        # 図形のないシートはスキップ
+        targets = [result for result in results if self._has_drawing(result.path, result.book, result.sheet)]
+        if not targets:
+            return excel
+
         # Excelアプリケーションを起動
-        excel = win32com.client.Dispatch('Excel.Application')
-        excel.Visible = False
-        excel.DisplayAlerts = False
+        if excel is None:
+            import win32com.client
+            excel = win32com.client.Dispatch('Excel.Application')
+            excel.Visible = False
+            excel.DisplayAlerts = False
 
-        # 進捗データ初期化
-        progress_cnt = 0
-        progress_max = self._pd_keyword.shape[0]
         workbook = None
-        current_workbook_path = None
-        # 進捗表示用フラグを初期化
-        progress = CommonProgress(total=progress_max, task_msg=self._doc_type+' Keyword in Shapes') if self._enable_progress else None
-
         try:
-            # ブック＋シートでキーワードを検索する
-            for output_index, output_row in self._pd_keyword.iterrows():
+            # ブックを開く
+            workbook = excel.Workbooks.Open(os.path.abspath(full_workbook_path), ReadOnly=True)
+            for result in targets:
                 try:
-                    # Bad Fileの場合はスキップ
-                    if output_row['Sheet'] == "Bad File Error":
-                        progress_cnt += 1
-                        if progress:
-                            progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
-                        continue
-
-                    # フルパスを生成してOpen済みか確認してブックを開く 
-                    full_workbook_path = os.path.abspath(os.path.join(output_row['Path'], output_row['Book']))
-                    # 既に開いているブックと異なる場合は新たに開く
-                    if(full_workbook_path != current_workbook_path):
-                        # 既に開いているブックがあれば閉じる
-                        if current_workbook_path is not None:
-                            workbook.Close(SaveChanges=False)
-                        current_workbook_path = full_workbook_path
-                        try:
-                            # ブックを開く
-                            workbook = excel.Workbooks.Open(full_workbook_path, ReadOnly=True)
-                        except:
-                            # ファイルが開けない場合はスキップ
-                            workbook = None
-
-                    # ブックが開けなかった場合はスキップ
-                    if workbook is None:
-                        progress_cnt += 1
-                        if progress:
-                            progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
-                        continue
-
                     # シートを指定する
-                    worksheet = workbook.Sheets(output_row['Sheet'])
+                    worksheet = workbook.Sheets(result.sheet)
 
                     # キーワードがシート内に含まれているかチェックする
-                    for keyword in keywords:
-                        # キーワード出現回数を初期化
-                        count = 0 if self._pd_keyword.at[output_index, keyword] in (None, "") else self._pd_keyword.at[output_index, keyword]
-                        # シート内の図形のテキストをチェック
-                        for shape in worksheet.Shapes:
-                            # グループ化された図形も再帰的にチェック
-                            try:
-                                count += self._search_keyword_shape_group(shape, keyword)
-                            except:
-                                pass
-                        self._pd_keyword.at[output_index, keyword] = count
+                    if result.counts is None:
+                        result.counts = {keyword:0 for keyword in matcher.keywords}
+                    # シート内の図形のテキストをチェック
+                    for shape in worksheet.Shapes:
+                        # グループ化された図形も再帰的にチェック
+                        try:
+                            self._search_keyword_shape_group(shape, matcher, result.counts)
+                        except:
+                            pass
                 except:
                     pass
-
-                # 進捗表示
-                progress_cnt += 1
-                if progress:
-                    progress.update(current=progress_cnt, status_msg=f'Processing: {progress_cnt}/{progress_max}')
+        except:
+            # ファイルが開けない場合はスキップ
+            pass
         finally:
-            # 0を空文字に置換
-            self._pd_keyword = self._pd_keyword.replace(0, "")
-
-            # Excelアプリケーションを終了
             try:
                 if workbook is not None:
                     workbook.Close(SaveChanges=False)
             except:
                 pass
-            try:
-                excel.Quit()
-            except:
-                pass
-            del excel
-            # 進捗表示(100%)
-            if progress:
-                progress.complete()
+        return excel
 
-    def _search_keyword_shape_group(self, shape, keyword) -> int:
+    def _search_keyword_shape_group(self, shape, matcher:KeywordMatcher, counts:dict) -> None:
             """グループ化された図形を再帰的にチェックするサブメソッド
             Args:
                 shape: 図形オブジェクト
-                keyword (str): 検索キーワード
-            Returns:
-                int: キーワード出現回数
+                matcher (KeywordMatcher): キーワード照合オブジェクト
+                counts (dict): キーワードごとの出現数（図形内の出現数を加算する）
             """
-            count = 0
             # Type 6 は msoGroup (グループ化された図形)
             if shape.Type == 6:
                 try:
                     # グループ内の図形を再帰的にチェック
                     for sub_shape in shape.GroupItems:
-                        count += self._search_keyword_shape_group(sub_shape, keyword)
+                        self._search_keyword_shape_group(sub_shape, matcher, counts)
                 except:
                     pass
             else:
                 try:
                     # テキストを持っているか判定
                     if shape.HasTextFrame:
-                        # テキストを取得してキーワードが含まれるかチェック
+                        # テキストを取得して含まれるキーワードをカウント
                         txt = shape.TextFrame.Characters().Text
-                        if txt and keyword in txt:
-                            count += 1
+                        if txt:
+                            for keyword in matcher.match(txt):
+                                counts[keyword] += 1
                 except:
-                    pass
-            # キーワード出現回数を返す
-            return count
\ No newline at end of file
+                    pass
\ No newline at end of file